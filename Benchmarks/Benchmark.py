@@ -0,0 +1,331 @@
+# Benchmark.py
+#
+# Runs every tutorial entry point headless and records how long it takes. Each benchmark is
+# run in its own Python process from the directory of its script, with that directory on the
+# PYTHONPATH and a non-interactive matplotlib backend, so a tutorial imports its sibling
+# modules as when it is run directly and the peak resident memory of one case is not
+# inflated by another.
+# Plotting is turned off unless --plots is given, in which case its time is booked to the
+# post_process phase; the two kinds of run are not compared with each other.
+#
+# Usage:
+#   python Benchmark.py                      run all benchmarks, append to the history and
+#                                            compare against the stored baseline
+#   python Benchmark.py tutorial_01 Optimize run the benchmarks whose tag contains any argument
+#   python Benchmark.py --save-baseline      store this run as the new baseline
+#   python Benchmark.py --tolerance 0.3      flag cases more than 30% slower than the baseline
+#   python Benchmark.py --plots              also draw the figures and time them
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+benchmark_directory = os.path.dirname(os.path.abspath(__file__))
+repository_directory = os.path.dirname(benchmark_directory)
+history_file        = os.path.join(benchmark_directory, 'benchmark_history.json')
+baseline_file       = os.path.join(benchmark_directory, 'benchmark_baseline.json')
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+# functions whose time is booked to each phase. Entries are looked up on the benchmark module,
+# dotted entries on a module it imports. Whatever the entry point spends outside of these
+# functions, i.e. the mission evaluate() and the library analysis calls, is booked to the
+# mission_solve phase.
+phases = {
+    'vehicle_setup'  : ['vehicle_setup', 'load_aircraft_geometry', 'design_test_propeller', 'Vehicles.setup'],
+    'analysis_setup' : ['configs_setup', 'analyses_setup', 'base_analysis', 'Analyses.setup'],
+    'mission_setup'  : ['mission_setup', 'missions_setup', 'Missions.setup', 'Procedure.setup'],
+    'post_process'   : ['plot_mission', 'plot_results', 'plot_aircraft_aerodynamics', 'plot_rotor_disc_performance',
+                        'plot_3d_rotor', 'plot_3d_vehicle', 'plot_airfoil_surface_forces', 'plot_airfoil_polars',
+                        'plot_airfoil_boundary_layer_properties', 'plot_propeller_map', 'save_aircraft_geometry',
+                        'Plot_Mission.plot_mission'],
+}
+
+def optimization_entry_point(module):
+    """A single evaluation of the optimization problem at its initial inputs. The full SLSQP
+    run is left out since its length depends on the optimizer path rather than on the code."""
+
+    problem = module.setup()
+    problem.objective()
+    module.Plot_Mission.plot_mission(problem)
+
+    return
+
+def setup_benchmarks():
+
+    benchmarks = []
+    for folder in ['Mission_Simulation', 'Performance']:
+        for filename in sorted(os.listdir(os.path.join(repository_directory, folder))):
+            if filename.startswith('tutorial_') and filename.endswith('.py'):
+                benchmarks.append(dict(tag         = filename[:-3],
+                                       path        = os.path.join(repository_directory, folder, filename),
+                                       entry_point = None))
+
+    benchmarks.append(dict(tag         = 'Regional_Jet_Fuel_Burn_Optimization',
+                           path        = os.path.join(repository_directory, 'Optimization',
+                                                      'Regional_Jet_Fuel_Burn_Optimization', 'Optimize.py'),
+                           entry_point = optimization_entry_point))
+
+    return benchmarks
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    parser = argparse.ArgumentParser(description = 'Time the tutorial entry points.')
+    parser.add_argument('filters', nargs = '*', help = 'only run benchmarks whose tag contains one of these')
+    parser.add_argument('--save-baseline', action = 'store_true', help = 'store this run as the baseline')
+    parser.add_argument('--tolerance', type = float, default = 0.2, help = 'allowed relative slowdown')
+    parser.add_argument('--plots', action = 'store_true', help = 'draw the figures and time them as post_process')
+    parser.add_argument('--run', help = argparse.SUPPRESS)
+    parser.add_argument('--output', help = argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.run:
+        run_benchmark(arguments.run, arguments.output, arguments.plots)
+        return
+
+    benchmarks = setup_benchmarks()
+    if arguments.filters:
+        benchmarks = [b for b in benchmarks if any(f in b['tag'] for f in arguments.filters)]
+
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark['tag']] = run_isolated(benchmark, arguments.plots)
+        print_result(benchmark['tag'], results[benchmark['tag']])
+
+    record = dict(timestamp = time.strftime('%Y-%m-%dT%H:%M:%S'),
+                  commit    = git_commit(),
+                  python    = platform.python_version(),
+                  machine   = platform.node(),
+                  plots     = arguments.plots,
+                  results   = results)
+    append_history(record)
+
+    if arguments.save_baseline:
+        write_json(baseline_file, record)
+        print('baseline saved to ' + baseline_file)
+        return
+
+    baseline = read_json(baseline_file)
+    if baseline and baseline.get('plots', True) != arguments.plots:
+        print('baseline was run ' + ('with' if baseline.get('plots', True) else 'without') + ' plots, not compared')
+        return
+
+    regressions = find_regressions(results, baseline, arguments.tolerance)
+    for message in regressions:
+        print('REGRESSION: ' + message)
+    if regressions:
+        sys.exit(1)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Run One Benchmark
+# ----------------------------------------------------------------------
+def run_isolated(benchmark, plots = False):
+    """Runs a benchmark in a fresh interpreter and reads back the result it writes."""
+
+    directory   = os.path.dirname(benchmark['path'])
+    python_path = os.pathsep.join(filter(None, [directory, os.environ.get('PYTHONPATH')]))
+    environment = dict(os.environ, MPLBACKEND = 'Agg', PYTHONPATH = python_path)
+    handle, output = tempfile.mkstemp(suffix = '.json')
+    os.close(handle)
+
+    command = [sys.executable, os.path.abspath(__file__), '--run', benchmark['tag'], '--output', output]
+    if plots:
+        command.append('--plots')
+
+    try:
+        process = subprocess.run(command,
+                                 cwd = directory, env = environment,
+                                 stdout = subprocess.PIPE, stderr = subprocess.STDOUT, universal_newlines = True)
+        result = read_json(output)
+    finally:
+        os.remove(output)
+
+    if not result:
+        result = dict(status = 'failed', error = process.stdout[-2000:])
+
+    return result
+
+def run_benchmark(tag, output, plots = False):
+    """Executed inside the child process."""
+
+    import resource
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    benchmark = [b for b in setup_benchmarks() if b['tag'] == tag][0]
+    result    = dict(status = 'passed', phases = {})
+
+    start = time.perf_counter()
+    try:
+        specification = importlib.util.spec_from_file_location(tag, benchmark['path'])
+        module        = importlib.util.module_from_spec(specification)
+        specification.loader.exec_module(module)
+        result['phases']['import'] = time.perf_counter() - start
+
+        if not plots:
+            disable_plots(module)
+        timers = install_timers(module)
+        run    = time.perf_counter()
+        if benchmark['entry_point']:
+            benchmark['entry_point'](module)
+        else:
+            module.main()
+        total = time.perf_counter() - run
+
+        for phase, elapsed in timers.items():
+            result['phases'][phase] = elapsed
+        result['phases']['mission_solve'] = total - sum(timers.values())
+    except Exception:
+        result['status'] = 'failed'
+        result['error']  = traceback.format_exc()[-2000:]
+    finally:
+        plt.close('all')
+
+    result['wall_time'] = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result['peak_rss_MB'] = peak / (1024.**2 if sys.platform == 'darwin' else 1024.)
+
+    write_json(output, result)
+
+    return
+
+def disable_plots(module):
+    """Replaces the plot functions of the module, and the dotted post_process entries that
+    plot, with functions that do nothing."""
+
+    def skip_plot(*args, **kwargs):
+        return None
+
+    names  = [name for name in dir(module) if name.startswith('plot_')]
+    names += [name for name in phases['post_process'] if '.' in name and name.split('.')[-1].startswith('plot')]
+    for name in names:
+        owner = module
+        path  = name.split('.')
+        for part in path[:-1]:
+            owner = getattr(owner, part, None)
+        if owner is not None and callable(getattr(owner, path[-1], None)):
+            setattr(owner, path[-1], skip_plot)
+
+    return
+
+def install_timers(module):
+    """Wraps the phase functions the module uses so the time spent in them is accumulated.
+    Nested calls, such as vehicle_setup inside configs_setup, are only counted once."""
+
+    timers = {}
+    active = []
+
+    def timed(phase, function):
+        def wrapper(*args, **kwargs):
+            if active:
+                return function(*args, **kwargs)
+            active.append(phase)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timers[phase] += time.perf_counter() - start
+                active.pop()
+        return wrapper
+
+    for phase, names in phases.items():
+        timers[phase] = 0.
+        for name in names:
+            owner = module
+            path  = name.split('.')
+            for part in path[:-1]:
+                owner = getattr(owner, part, None)
+            if owner is not None and callable(getattr(owner, path[-1], None)):
+                setattr(owner, path[-1], timed(phase, getattr(owner, path[-1])))
+
+    return timers
+
+# ----------------------------------------------------------------------
+#   History and Baseline
+# ----------------------------------------------------------------------
+def find_regressions(results, baseline, tolerance):
+    """Cases that got slower or larger than the baseline by more than the tolerance, or that
+    stopped running."""
+
+    regressions = []
+    if not baseline:
+        return regressions
+
+    for tag, reference in baseline['results'].items():
+        if tag not in results or reference.get('status') != 'passed':
+            continue
+        result = results[tag]
+        if result['status'] != 'passed':
+            regressions.append(tag + ' failed')
+            continue
+        for quantity in ['wall_time', 'peak_rss_MB']:
+            if result[quantity] > reference[quantity] * (1. + tolerance):
+                regressions.append('{}: {} {:.2f} vs baseline {:.2f}'.format(tag, quantity, result[quantity], reference[quantity]))
+
+    return regressions
+
+def append_history(record):
+
+    history = read_json(history_file) or []
+    history.append(record)
+    write_json(history_file, history)
+
+    return
+
+def git_commit():
+
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd = repository_directory,
+                                       stderr = subprocess.DEVNULL, universal_newlines = True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def read_json(filename):
+
+    if not os.path.isfile(filename) or os.path.getsize(filename) == 0:
+        return None
+    with open(filename) as file:
+        return json.load(file)
+
+def write_json(filename, data):
+
+    with open(filename, 'w') as file:
+        json.dump(data, file, indent = 2)
+
+    return
+
+def print_result(tag, result):
+
+    if result['status'] != 'passed':
+        print('{:55s} FAILED'.format(tag))
+        print(result['error'])
+        return
+
+    phase_times = ', '.join('{} {:.2f}s'.format(phase, elapsed) for phase, elapsed in result['phases'].items())
+    print('{:55s} {:8.2f} s {:8.1f} MB   ({})'.format(tag, result['wall_time'], result['peak_rss_MB'], phase_times))
+
+    return
+
+if __name__ == '__main__':
+    main()
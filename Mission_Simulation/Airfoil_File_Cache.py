@@ -0,0 +1,176 @@
+# Airfoil_File_Cache.py
+#
+# Binary cache for the airfoil imports RCAIDE does while a vehicle is set up:
+# import_airfoil_geometry, import_airfoil_polars and compute_airfoil_properties. Within a
+# cached_airfoil_imports block every loaded RCAIDE module calls these through the cache. A
+# result is stored under a hash of the function and its arguments, with the coordinate and
+# polar files they name hashed by content, so an edited file is parsed again while an
+# unchanged one is loaded from the archive without parsing.
+#
+# Results are saved as a single .npy record of their arrays in the user cache folder and
+# read back without unpickling. Results that hold anything other than Data, arrays, numbers,
+# strings and lists of these are only kept in the memory cache of the process.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from RCAIDE.Framework.Core import Data
+
+import os
+import sys
+import inspect
+import numpy as np
+from contextlib import contextmanager
+from copy import deepcopy
+
+from Data_Hash import data_hash, user_cache_directory
+
+cached_functions = ['import_airfoil_geometry', 'import_airfoil_polars', 'compute_airfoil_properties']
+
+cache_directory  = user_cache_directory('airfoil_cache')
+
+# results of this process, by hash
+_memory_cache = {}
+
+# ----------------------------------------------------------------------
+#   Cached Airfoil Imports
+# ----------------------------------------------------------------------
+@contextmanager
+def cached_airfoil_imports():
+    """Routes the airfoil imports of every loaded RCAIDE module through the cache for the
+    duration of the block, and puts the library functions back afterwards."""
+
+    wrappers = {}
+    patched  = []
+    for name, module in list(sys.modules.items()):
+        if not name.startswith('RCAIDE') or module is None:
+            continue
+        for tag in cached_functions:
+            function = vars(module).get(tag)
+            if not inspect.isfunction(function) or getattr(function, 'airfoil_cache', False):
+                continue
+            if function not in wrappers:
+                wrappers[function] = cached_function(function)
+            setattr(module, tag, wrappers[function])
+            patched.append((module, tag, function))
+
+    try:
+        yield
+    finally:
+        for module, tag, function in patched:
+            setattr(module, tag, function)
+
+def cached_function(function):
+
+    def cached(*args, **kwargs):
+        key = data_hash(function.__module__ + '.' + function.__name__, list(args), kwargs)
+        if key not in _memory_cache:
+            value = load_archive(key)
+            if value is None:
+                value = function(*args, **kwargs)
+                save_archive(key, value)
+            _memory_cache[key] = value
+
+        # callers may modify what they get, e.g. by appending a rotor's polars to its airfoil
+        return deepcopy(_memory_cache[key])
+
+    cached.__wrapped__   = function
+    cached.__name__      = function.__name__
+    cached.airfoil_cache = True
+
+    return cached
+
+# ----------------------------------------------------------------------
+#   Archives
+# ----------------------------------------------------------------------
+def load_archive(key):
+    """Result stored under key, or None if there is no readable archive."""
+
+    cache_file = os.path.join(cache_directory, key + '.npy')
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        record = np.load(cache_file, allow_pickle = False)
+    except (OSError, ValueError):
+        return None
+    if record.dtype.names is None:
+        return None
+
+    return unflatten({name : record[name] for name in record.dtype.names})
+
+def save_archive(key, value):
+    """Writes value through a temporary file. Values that cannot be stored as a record, and
+    cache folders that cannot be written to, simply go without an archive.
+
+    The archive is a single uncompressed record with one field per array, which loads in one
+    read; an npz archive of the same arrays takes several times longer to open than it takes
+    to parse a polar file of a few hundred lines."""
+
+    fields = flatten(value)
+    if fields is None or not fields:
+        return
+
+    record = np.zeros((), dtype = [(name, array.dtype, array.shape) for name, array in fields.items()])
+    for name, array in fields.items():
+        record[name] = array
+
+    cache_file = os.path.join(cache_directory, key + '.npy')
+    try:
+        os.makedirs(cache_directory, exist_ok = True)
+        with open(cache_file + '.tmp', 'wb') as file:
+            np.save(file, record)
+        os.replace(cache_file + '.tmp', cache_file)
+    except OSError:
+        pass
+
+    return
+
+def flatten(value, path = ''):
+    """Arrays of a Data tree by dotted path, lists marked with a list: prefix, or None if the
+    tree holds anything else or an empty Data, which the record could not bring back."""
+
+    if type(value) is Data:
+        if not value:
+            return None
+        fields = {}
+        for tag, item in value.items():
+            if not isinstance(tag, str) or '.' in tag or ':' in tag:
+                return None
+            item_fields = flatten(item, path + tag + '.')
+            if item_fields is None:
+                return None
+            fields.update(item_fields)
+        return fields
+
+    name = path[:-1]
+    if not isinstance(value, (list, np.ndarray, str, bool, int, float, np.number, np.bool_)):
+        return None
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        # ragged lists
+        return None
+    if isinstance(value, list):
+        name = 'list:' + name
+    if array.dtype.kind not in 'biufcU':
+        return None
+
+    return {name : array}
+
+def unflatten(fields):
+
+    value = Data()
+    for name, array in fields.items():
+        is_list = name.startswith('list:')
+        path    = name[5:].split('.') if is_list else name.split('.')
+        item    = array.tolist() if is_list else (array[()] if array.ndim == 0 else np.array(array))
+
+        owner = value
+        for tag in path[:-1]:
+            if tag not in owner:
+                owner[tag] = Data()
+            owner = owner[tag]
+        owner[path[-1]] = item
+
+    return value
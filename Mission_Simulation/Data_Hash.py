@@ -0,0 +1,130 @@
+# Data_Hash.py
+#
+# Stable content hashes of RCAIDE Data trees, and the cache folders of the on-disk caches of
+# the tutorials. Dicts are hashed with their keys in sorted order, arrays by dtype, shape and
+# bytes, and strings naming an existing file also by the content of that file, so a cache
+# entry follows the data it was built from.
+#
+# Cache entries holding whole analyses or rotors are pickles, and loading a pickle can run
+# arbitrary code. They are kept in the user cache folder, outside of the source tree, and
+# only read from a folder that is owned by the current user and not writable by others.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import RCAIDE
+
+import numpy as np
+import hashlib
+import pickle
+import stat
+import os
+
+# ----------------------------------------------------------------------
+#   Data Hash
+# ----------------------------------------------------------------------
+def data_hash(*values, exclude = ()):
+    """Hex digest of the RCAIDE version and of every value, skipping the keys in exclude."""
+
+    digest = hashlib.sha1()
+    digest.update(str(getattr(RCAIDE, '__version__', '')).encode())
+    for value in values:
+        update_hash(digest, value, exclude)
+
+    return digest.hexdigest()
+
+def update_hash(digest, value, exclude = (), active = None):
+    """Adds value to digest. Keys in exclude are skipped at any depth. A dict or list that is
+    already being hashed further up the tree, such as a vehicle referenced from its own
+    analyses, only adds a marker, so cyclic references terminate."""
+
+    if active is None:
+        active = set()
+
+    if isinstance(value, (dict, list, tuple)):
+        if id(value) in active:
+            digest.update(b'<cycle>')
+            return digest
+        active.add(id(value))
+        try:
+            if isinstance(value, dict):
+                digest.update(('<' + type(value).__name__ + '>').encode())
+                for tag in sorted(value.keys(), key = str):
+                    if tag in exclude:
+                        continue
+                    digest.update(str(tag).encode())
+                    update_hash(digest, value[tag], exclude, active)
+            else:
+                digest.update(b'[')
+                for item in value:
+                    update_hash(digest, item, exclude, active)
+                digest.update(b']')
+        finally:
+            active.discard(id(value))
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(str(value.dtype).encode() + str(value.shape).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.ndarray):
+        update_hash(digest, value.tolist(), exclude, active)
+    elif isinstance(value, str):
+        digest.update(value.encode())
+        if os.path.isfile(value):
+            digest.update(file_hash(value).encode())
+    elif isinstance(value, (bool, int, float, complex, np.number, np.bool_)) or value is None:
+        digest.update(repr(value).encode())
+    else:
+        # functions and other objects only contribute their type
+        digest.update(type(value).__name__.encode())
+
+    return digest
+
+def file_hash(path):
+
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+# ----------------------------------------------------------------------
+#   Cache Folders
+# ----------------------------------------------------------------------
+def user_cache_directory(name):
+    """Folder name of the tutorials in the user cache, $XDG_CACHE_HOME or ~/.cache."""
+
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(root, 'rcaide_tutorials', name)
+
+def trusted_directory(directory):
+    """True if directory belongs to the current user and others cannot write to it. Always
+    true on platforms without file ownership."""
+
+    if not hasattr(os, 'getuid'):
+        return True
+
+    status = os.stat(directory)
+
+    return status.st_uid == os.getuid() and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+def load_pickle(directory, key):
+    """Object stored under key in directory, or None if there is no entry or the directory is
+    not trusted."""
+
+    cache_file = os.path.join(directory, key + '.pkl')
+    if not os.path.isfile(cache_file) or not trusted_directory(directory):
+        return None
+
+    with open(cache_file, 'rb') as file:
+        return pickle.load(file)
+
+def save_pickle(directory, key, value):
+    """Stores value under key in directory, which is created readable by the user only."""
+
+    os.makedirs(directory, mode = 0o700, exist_ok = True)
+
+    # write to a temporary file first so a crash never leaves a truncated entry
+    cache_file = os.path.join(directory, key + '.pkl')
+    with open(cache_file + '.tmp', 'wb') as file:
+        pickle.dump(value, file)
+    os.replace(cache_file + '.tmp', cache_file)
+
+    return
@@ -0,0 +1,59 @@
+# Rotor_Design_Cache.py
+#
+# Persistent cache for the blade optimizations of design_propeller, design_prop_rotor and
+# design_lift_rotor. A designed rotor is stored under a hash of the design function and of
+# everything set on the rotor before the design, with referenced airfoil and polar files
+# hashed by content, so a vehicle setup that defines the same rotor again restores the
+# design instead of repeating the optimization.
+#
+# Entries are pickles in the user cache folder, $XDG_CACHE_HOME/rcaide_tutorials, and are
+# only loaded from a folder no other user can write to.
+#
+# The hover, OEI and cruise design points are evaluated inside the SciPy objective of the
+# library design functions, so they are not evaluated in parallel here; a cached design skips
+# that objective altogether.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from Data_Hash import data_hash, user_cache_directory, load_pickle, save_pickle
+
+cache_directory = user_cache_directory('rotor_design_cache')
+
+# ----------------------------------------------------------------------
+#   Design Rotor
+# ----------------------------------------------------------------------
+def design_rotor(design_function, rotor):
+    """Designs rotor in place with design_function, or restores the cached design of an
+    identical rotor."""
+
+    key    = design_hash(design_function, rotor)
+    cached = load_pickle(cache_directory, key)
+
+    if cached is not None:
+        restore_design(rotor, cached)
+        return rotor
+
+    designed = design_function(rotor)
+
+    # some design functions return the rotor, others only modify it
+    designed = rotor if designed is None else designed
+    restore_design(rotor, designed)
+    save_pickle(cache_directory, key, designed)
+
+    return rotor
+
+def restore_design(rotor, designed):
+
+    if designed is rotor:
+        return
+    for tag in list(designed.keys()):
+        rotor[tag] = designed[tag]
+
+    return
+
+def design_hash(design_function, rotor):
+    """Stable hash of the design function and of the rotor before the design."""
+
+    return data_hash(design_function.__module__ + '.' + design_function.__name__, rotor)
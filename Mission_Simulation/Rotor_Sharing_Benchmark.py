@@ -0,0 +1,105 @@
+# Rotor_Sharing_Benchmark.py
+#
+# Memory held by the vehicle and configurations of a rotorcraft tutorial, and the time
+# configs_setup takes to copy the vehicle into them, with the rotor data shared between the
+# copies and with every copy holding its own arrays. The unshared case replaces the
+# tutorial's share_rotor_data with a function that does nothing. Memory is traced with
+# tracemalloc and counts what is still allocated after the setup returns. The size of the
+# arrays share_rotor_data froze on the vehicle is printed too, as the most the sharing can
+# save per copy. No results are quoted here; run it with RCAIDE installed.
+#
+# Usage:
+#   python Rotor_Sharing_Benchmark.py                 tutorial 06, best of 5 repeats
+#   python Rotor_Sharing_Benchmark.py tutorial_07 3   tutorial, repeats
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import time
+import glob
+import importlib
+import tracemalloc
+
+import matplotlib
+matplotlib.use('Agg')
+
+from Shared_Rotor_Data import Shared_Array
+
+mission_directory = os.path.dirname(os.path.abspath(__file__))
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    tag     = sys.argv[1] if len(sys.argv) > 1 else 'tutorial_06'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    script   = glob.glob(os.path.join(mission_directory, tag + '*.py'))[0]
+    tutorial = importlib.import_module(os.path.splitext(os.path.basename(script))[0])
+    share    = tutorial.share_rotor_data
+
+    # the tutorials resolve their airfoil files relative to the script
+    os.chdir(mission_directory)
+
+    print(os.path.basename(script))
+    print('shared arrays per vehicle copy: {:.2f} MB'.format(shared_bytes(tutorial.vehicle_setup()) / 1E6))
+    print('{:10s} {:>14s} {:>14s} {:>18s}'.format('', 'vehicle [MB]', 'configs [MB]', 'configs_setup [s]'))
+    for case, function in [('unshared', lambda rotor, *args, **kwargs: rotor), ('shared', share)]:
+        tutorial.share_rotor_data = function
+        vehicle_memory, configs_memory = traced_memory(tutorial)
+        setup_time = best_time(tutorial, repeats)
+        print('{:10s} {:14.2f} {:14.2f} {:18.4f}'.format(case, vehicle_memory / 1E6, configs_memory / 1E6, setup_time))
+
+    tutorial.share_rotor_data = share
+
+    return
+
+def traced_memory(tutorial):
+    """Bytes still allocated after vehicle_setup and, on top of those, after configs_setup."""
+
+    tracemalloc.start()
+    start   = tracemalloc.get_traced_memory()[0]
+    vehicle = tutorial.vehicle_setup()
+    built   = tracemalloc.get_traced_memory()[0]
+    configs = tutorial.configs_setup(vehicle)
+    copied  = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return built - start, copied - built
+
+def shared_bytes(data, seen = None):
+    """Bytes held by the distinct read-only Shared_Arrays reachable from data."""
+
+    seen  = set() if seen is None else seen
+    total = 0
+    if id(data) in seen:
+        return 0
+    seen.add(id(data))
+
+    if isinstance(data, Shared_Array) and not data.flags.writeable:
+        return data.nbytes
+    if isinstance(data, dict):
+        total += sum(shared_bytes(value, seen) for value in data.values())
+    elif isinstance(data, (list, tuple)):
+        total += sum(shared_bytes(value, seen) for value in data)
+
+    return total
+
+def best_time(tutorial, repeats):
+
+    vehicle = tutorial.vehicle_setup()
+
+    times = []
+    for _ in range(repeats):
+        start   = time.perf_counter()
+        configs = tutorial.configs_setup(vehicle)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,429 @@
+'''
+# Segment_Solvers.py
+#
+# Drop-in replacements for the converge step of a mission segment. The segment residuals are
+# still evaluated through segment.process.iterate, only the way the Newton Jacobian is built
+# changes. To use one, assign it to the converge process of a segment:
+#
+#     segment.process.converge = converge_sparse_newton
+#
+# converge_sparse_newton assumes the residuals at a control point only depend on the unknowns
+# at that control point, converge_colored_newton detects the structure from the Jacobian and
+# drops its weak entries, which makes it a quasi-Newton method.
+#
+# adaptive_converge wraps any of these, or the default converge step, so that a segment with
+# numerics.adaptive_control_points set picks its number of control points from the Chebyshev
+# spectrum of its converged solution:
+#
+#     segment.state.numerics.adaptive_control_points = True
+#     segment.process.converge = adaptive_converge(segment.process.converge)
+'''
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+
+import numpy as np
+from copy import deepcopy
+
+# ----------------------------------------------------------------------
+#   Newton Solver
+# ----------------------------------------------------------------------
+def converge_sparse_newton(segment):
+    """Damped Newton solve of the segment residuals. The Jacobian is built with finite
+    differences that exploit the per-control-point independence of the residuals, so each
+    Jacobian costs one residual evaluation per unknown variable instead of one per unknown
+    variable and control point. If a step fails to reduce the residual the Jacobian is rebuilt
+    densely before giving up.
+
+    Segments with a scalar residual, which may depend on every unknown, are solved with the
+    detected coloring of converge_colored_newton instead."""
+
+    initialize_statistics(segment)
+
+    colors = block_diagonal_colors(segment)
+    if colors is None:
+        tolerance = getattr(segment.state.numerics, 'jacobian_sparsity_tolerance', 1E-2)
+        newton_solve(segment, None, sparsity_tolerance = tolerance)
+    else:
+        newton_solve(segment, colors)
+
+    return
+
+def converge_colored_newton(segment):
+    """Damped Newton solve that detects the sparsity of the residual Jacobian instead of
+    assuming it. The first Jacobian of a segment is built densely, its nonzero pattern is
+    colored so that no two columns of one color share a row, and every later Jacobian costs one
+    residual evaluation per color. The coloring is kept on the segment and reused by later
+    evaluations as long as the number of unknowns and residuals is unchanged.
+
+    Entries smaller than numerics.jacobian_sparsity_tolerance times the largest entry of their
+    row are left out of the pattern, so weak couplings such as those through the integrated
+    mass do not make the coloring dense. The Jacobians built from the coloring miss those
+    entries, which makes this a quasi-Newton method: it converges linearly rather than
+    quadratically near the solution, but the residuals are evaluated exactly, so the solution
+    it converges to is the same. A step the approximate Jacobian cannot make rebuilds it
+    densely, and with it the coloring."""
+
+    initialize_statistics(segment)
+
+    numerics  = segment.state.numerics
+    tolerance = getattr(numerics, 'jacobian_sparsity_tolerance', 1E-2)
+    unknowns  = segment.state.unknowns.pack_array()
+    residuals = segment.state.residuals.pack_array()
+    coloring  = getattr(segment, 'jacobian_coloring', None)
+    colors    = None
+
+    if coloring is not None and coloring.shape == (len(residuals), len(unknowns)):
+        colors = coloring.colors
+
+    newton_solve(segment, colors, sparsity_tolerance = tolerance)
+
+    return
+
+def initialize_statistics(segment):
+
+    statistics                      = Data()
+    statistics.iterations           = 0
+    statistics.residual_evaluations = 0
+    statistics.jacobian_evaluations = 0
+    segment.state.numerics.solver_statistics = statistics
+
+    return statistics
+
+def newton_solve(segment, colors, sparsity_tolerance = None):
+    """Newton iterations shared by the solvers above. colors is the coloring used for the
+    Jacobian; when it is None and sparsity_tolerance is given, a dense Jacobian is built and
+    colored, and the coloring is stored on the segment for later solves."""
+
+    numerics       = segment.state.numerics
+    statistics     = numerics.solver_statistics
+    tolerance      = numerics.tolerance_solution
+    max_iterations = getattr(numerics, 'max_newton_iterations', 50)
+
+    unknowns  = segment.state.unknowns.pack_array()
+    residuals = evaluate_residuals(unknowns, segment)
+    converged = np.linalg.norm(residuals) == 0.
+
+    while not converged and statistics.iterations < max_iterations:
+        statistics.iterations += 1
+
+        if colors is None:
+            jacobian = dense_jacobian(segment, unknowns, residuals)
+            colors   = detect_coloring(segment, jacobian, sparsity_tolerance)
+        else:
+            jacobian = colored_jacobian(segment, unknowns, residuals, colors)
+        step, new_unknowns, new_residuals = line_search(segment, jacobian, unknowns, residuals)
+
+        if step is None:
+            # the approximate Jacobian missed some coupling, retry once with the full one
+            jacobian = dense_jacobian(segment, unknowns, residuals)
+            if sparsity_tolerance is not None:
+                colors = detect_coloring(segment, jacobian, sparsity_tolerance)
+            step, new_unknowns, new_residuals = line_search(segment, jacobian, unknowns, residuals)
+            if step is None:
+                break
+
+        converged = np.linalg.norm(step) <= tolerance * (np.linalg.norm(new_unknowns) + tolerance) \
+                    or np.linalg.norm(new_residuals) == 0.
+        unknowns  = new_unknowns
+        residuals = new_residuals
+
+    # leave the segment conditions consistent with the returned unknowns
+    evaluate_residuals(unknowns, segment)
+
+    numerics.converged = bool(converged)
+    segment.converged  = bool(converged)
+    if not converged:
+        print("Segment did not converge. Segment Tag: " + segment.tag)
+
+    return
+
+def evaluate_residuals(unknowns, segment):
+
+    segment.state.unknowns.unpack_array(unknowns)
+    segment.process.iterate(segment)
+    residuals = segment.state.residuals.pack_array()
+
+    segment.state.numerics.solver_statistics.residual_evaluations += 1
+
+    return residuals
+
+def line_search(segment, jacobian, unknowns, residuals, minimum_step = 1. / 64):
+    """Backtracks along the Newton direction until the residual norm decreases. Returns
+    (None, None, None) if no acceptable step is found."""
+
+    direction = -np.linalg.lstsq(jacobian, residuals, rcond = None)[0]
+    norm      = np.linalg.norm(residuals)
+    alpha     = 1.
+
+    while alpha >= minimum_step:
+        new_unknowns  = unknowns + alpha * direction
+        new_residuals = evaluate_residuals(new_unknowns, segment)
+        if np.linalg.norm(new_residuals) < (1. - 1E-4 * alpha) * norm:
+            return alpha * direction, new_unknowns, new_residuals
+        alpha = alpha / 2.
+
+    return None, None, None
+
+# ----------------------------------------------------------------------
+#   Jacobians
+# ----------------------------------------------------------------------
+def finite_difference_step(unknowns):
+
+    return np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns), 1.)
+
+def dense_jacobian(segment, unknowns, residuals):
+    """Forward differences, one residual evaluation per packed unknown."""
+
+    segment.state.numerics.solver_statistics.jacobian_evaluations += 1
+
+    step     = finite_difference_step(unknowns)
+    jacobian = np.zeros((len(residuals), len(unknowns)))
+    for j in range(len(unknowns)):
+        perturbed      = unknowns.copy()
+        perturbed[j]  += step[j]
+        jacobian[:, j] = (evaluate_residuals(perturbed, segment) - residuals) / step[j]
+
+    return jacobian
+
+def colored_jacobian(segment, unknowns, residuals, colors):
+    """Forward differences where all unknowns of one color are perturbed together. colors is a
+    Data with, for each color, the packed unknown indices it perturbs and, for each of those,
+    the packed residual indices it is allowed to change."""
+
+    segment.state.numerics.solver_statistics.jacobian_evaluations += 1
+
+    step     = finite_difference_step(unknowns)
+    jacobian = np.zeros((len(residuals), len(unknowns)))
+    for color in colors.values():
+        perturbed                 = unknowns.copy()
+        perturbed[color.columns] += step[color.columns]
+        difference                = evaluate_residuals(perturbed, segment) - residuals
+        for column, rows in zip(color.columns, color.rows):
+            jacobian[rows, column] = difference[rows] / step[column]
+
+    return jacobian
+
+def block_diagonal_colors(segment):
+    """Colors the unknowns by their position within a control point. Unknowns of the same color
+    sit at different control points, so under per-control-point independence their effects on
+    the residuals do not overlap. A scalar unknown, such as a segment duration, may change
+    every residual and gets a color of its own. Returns None if there is a scalar residual,
+    since any unknown may change it and no two unknowns can then share a color."""
+
+    points          = segment.state.numerics.number_of_control_points
+    unknown_points  = control_point_index(segment.state.unknowns, points)
+    residual_points = control_point_index(segment.state.residuals, points)
+
+    if np.any(residual_points < 0):
+        return None
+
+    colors = Data()
+    for column in np.where(unknown_points < 0)[0]:
+        tag                 = 'scalar_' + str(column)
+        colors[tag]         = Data()
+        colors[tag].columns = [column]
+        colors[tag].rows    = [np.arange(len(residual_points))]
+
+    for point in np.unique(unknown_points[unknown_points >= 0]):
+        for color_index, column in enumerate(np.where(unknown_points == point)[0]):
+            tag = 'color_' + str(color_index)
+            if tag not in colors:
+                colors[tag]         = Data()
+                colors[tag].columns = []
+                colors[tag].rows    = []
+            colors[tag].columns.append(column)
+            colors[tag].rows.append(np.where(residual_points == point)[0])
+
+    for color in colors.values():
+        color.columns = np.array(color.columns)
+
+    return colors
+
+def detect_coloring(segment, jacobian, sparsity_tolerance):
+    """Colors the sparsity pattern of a dense Jacobian and stores the coloring on the segment.
+    Entries below sparsity_tolerance times the largest entry of their row are dropped from the
+    pattern, so Jacobians built from the coloring are approximate wherever they were nonzero."""
+
+    scale    = np.max(np.abs(jacobian), axis = 1, keepdims = True)
+    pattern  = np.abs(jacobian) > sparsity_tolerance * np.where(scale > 0., scale, 1.)
+    colors   = greedy_coloring(pattern)
+
+    segment.jacobian_coloring        = Data()
+    segment.jacobian_coloring.shape  = jacobian.shape
+    segment.jacobian_coloring.colors = colors
+
+    return colors
+
+def greedy_coloring(pattern):
+    """Greedy distance-2 coloring of the columns of a boolean sparsity pattern: two columns get
+    different colors if they have a nonzero in the same row. Columns are visited from the most
+    to the least connected, which keeps the number of colors close to the largest number of
+    nonzeros in any row."""
+
+    n_rows, n_columns = pattern.shape
+    column_color      = -np.ones(n_columns, dtype = int)
+    row_colors        = [set() for _ in range(n_rows)]
+
+    for column in np.argsort(-np.sum(pattern, axis = 0), kind = 'stable'):
+        rows      = np.where(pattern[:, column])[0]
+        forbidden = set().union(*[row_colors[row] for row in rows]) if len(rows) else set()
+        color     = 0
+        while color in forbidden:
+            color += 1
+        column_color[column] = color
+        for row in rows:
+            row_colors[row].add(color)
+
+    colors = Data()
+    for color in range(np.max(column_color) + 1 if n_columns else 0):
+        columns             = np.where(column_color == color)[0]
+        tag                 = 'color_' + str(color)
+        colors[tag]         = Data()
+        colors[tag].columns = columns
+        colors[tag].rows    = [np.where(pattern[:, column])[0] for column in columns]
+
+    return colors
+
+def control_point_index(data, points):
+    """Packs a Data of (control point, n) arrays into the same layout as pack_array, but with
+    every entry replaced by the index of the control point it belongs to. Scalar entries, and
+    arrays whose first axis is not one row per control point, get -1."""
+
+    index = deepcopy(data)
+    fill_control_point_index(index, points)
+
+    return index.pack_array()
+
+def fill_control_point_index(data, points):
+
+    for key, value in data.items():
+        if isinstance(value, Data):
+            fill_control_point_index(value, points)
+        elif isinstance(value, np.ndarray) and value.ndim > 0 and value.shape[0] == points:
+            rows       = np.arange(value.shape[0], dtype = float)
+            data[key]  = np.zeros(value.shape) + rows.reshape((-1,) + (1,) * (value.ndim - 1))
+        elif isinstance(value, np.ndarray):
+            data[key]  = -np.ones(value.shape)
+        elif isinstance(value, (float, int, np.number)) and not isinstance(value, bool):
+            data[key]  = -1.
+
+    return
+
+# ----------------------------------------------------------------------
+#   Adaptive Control Points
+# ----------------------------------------------------------------------
+def adaptive_converge(converge):
+    """Converge step that solves the segment with converge and then, if the segment has
+    numerics.adaptive_control_points set, doubles its control points while the estimated
+    discretization error exceeds numerics.adaptive_tolerance, up to numerics.max_control_points.
+    Each refinement initializes the segment again on the new control points and starts from the
+    previous solution interpolated onto them.
+
+    Assumptions:
+        every unknown is either one row per control point or the same for any number of them
+    """
+
+    def converge_adaptive(segment):
+
+        converge(segment)
+
+        numerics = segment.state.numerics
+        if not getattr(numerics, 'adaptive_control_points', False):
+            return
+
+        tolerance          = getattr(numerics, 'adaptive_tolerance', 1E-3)
+        max_control_points = getattr(numerics, 'max_control_points', 32)
+        while numerics.number_of_control_points < max_control_points and discretization_error(segment) > tolerance:
+            guess = segment_solution(segment)
+            collapse_rows(segment.state, numerics.number_of_control_points)
+            numerics.number_of_control_points = min(2 * numerics.number_of_control_points, max_control_points)
+            segment.process.initialize.evaluate(segment)
+            apply_adaptive_guess(segment, guess)
+            converge(segment)
+
+        return
+
+    return converge_adaptive
+
+def segment_solution(segment):
+    """Converged unknowns of a segment with the control points they are at."""
+
+    solution                = Data()
+    solution.unknowns       = Data()
+    solution.control_points = np.array(segment.state.numerics.dimensionless.control_points[:, 0], copy = True)
+    for key, value in segment.state.unknowns.items():
+        solution.unknowns[key] = np.array(value, copy = True)
+
+    return solution
+
+def collapse_rows(data, points):
+    """Reduces every array with one row per control point to its first row, the state of a
+    segment before it is initialized, so initializing it again expands it to the new number of
+    control points. The initial conditions and numerics are left alone."""
+
+    for tag, value in data.items():
+        if tag in ('initials', 'numerics'):
+            continue
+        if isinstance(value, Data):
+            collapse_rows(value, points)
+        elif isinstance(value, np.ndarray) and value.ndim > 1 and value.shape[0] == points:
+            data[tag] = np.array(value[:1], copy = True)
+
+    return
+
+def apply_adaptive_guess(segment, guess):
+
+    unknowns = segment.state.unknowns
+    points   = segment.state.numerics.dimensionless.control_points[:, 0]
+    previous = len(guess.control_points)
+
+    # unknowns at the control points are interpolated, the others are taken as they are
+    for key, value in guess.unknowns.items():
+        if key not in unknowns:
+            continue
+        if np.ndim(value) == 2 and np.shape(value)[0] == previous and np.shape(unknowns[key]) == (len(points), np.shape(value)[1]):
+            unknowns[key] = np.stack([np.interp(points, guess.control_points, column) for column in value.T], axis = 1)
+        elif np.shape(unknowns[key]) == np.shape(value):
+            unknowns[key] = np.array(value, copy = True)
+
+    return
+
+def discretization_error(segment):
+    """Largest Chebyshev tail estimate over the altitude, mass and battery state of charge
+    histories of a converged segment."""
+
+    conditions = segment.state.conditions
+    points     = segment.state.numerics.dimensionless.control_points[:, 0]
+    histories  = [conditions.freestream.altitude, conditions.weights.total_mass]
+    histories += find_arrays(conditions.energy, 'state_of_charge')
+
+    return max(chebyshev_error(history[:, 0], points) for history in histories)
+
+def chebyshev_error(values, points):
+    """Fits a Chebyshev series through the values at the control points, mapped from [0, 1] to
+    [-1, 1], and compares the last two coefficients to the largest non-constant one. A smooth,
+    resolved history has a fast decaying spectrum and a small ratio."""
+
+    n = len(values)
+    if n < 3:
+        return np.inf
+
+    coefficients = np.abs(np.polynomial.chebyshev.chebfit(2. * points - 1., values, n - 1))
+    variation    = np.max(coefficients[1:])
+    if variation <= 1E-12 * max(coefficients[0], 1.):
+        return 0.
+
+    return (coefficients[-1] + coefficients[-2]) / variation
+
+def find_arrays(data, key):
+
+    arrays = []
+    for tag, value in data.items():
+        if isinstance(value, Data):
+            arrays += find_arrays(value, key)
+        elif tag == key and isinstance(value, np.ndarray):
+            arrays.append(value)
+
+    return arrays
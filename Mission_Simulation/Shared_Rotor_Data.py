@@ -0,0 +1,102 @@
+# Shared_Rotor_Data.py
+#
+# Sharing of the fixed arrays of a designed rotor between the copies the tutorials make of
+# it: one propulsor per rotor position, then one vehicle per configuration. Only a list of
+# known static fields is frozen, the blade geometry and the airfoil geometry and polars, as
+# read-only arrays that deepcopy and pickle pass on by reference instead of duplicating.
+# Copies stay independent: assigning a new array to an attribute of one copy leaves the
+# others alone, while writing into a shared array in place raises, since it would change
+# every copy.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# blade geometry that the rotor design sets once and the analyses only read
+static_rotor_fields = ['radius_distribution', 'chord_distribution', 'twist_distribution', 'sweep_distribution',
+                       'mid_chord_alignment', 'thickness_to_chord', 'max_thickness_distribution']
+
+# airfoil data imported from the coordinate and polar files, frozen at any depth below them
+static_airfoil_fields = ['geometry', 'polars']
+
+# ----------------------------------------------------------------------
+#   Share Rotor Data
+# ----------------------------------------------------------------------
+def share_rotor_data(rotor):
+    """Freezes the static data of rotor so that copies of the rotor share it: the blade
+    geometry in static_rotor_fields and the geometry and polars of its airfoils. Everything
+    else, including the design and operating state RCAIDE may update in place, is left as it
+    is."""
+
+    for tag in static_rotor_fields:
+        if is_numeric_array(rotor.get(tag)):
+            rotor[tag] = shared_array(rotor[tag])
+
+    for airfoil in rotor.get('airfoils', {}).values():
+        for tag in static_airfoil_fields:
+            if isinstance(airfoil.get(tag), dict):
+                freeze_arrays(airfoil[tag])
+
+    return rotor
+
+def freeze_arrays(data):
+
+    for tag in list(data.keys()):
+        value = data[tag]
+        if isinstance(value, dict):
+            freeze_arrays(value)
+        elif is_numeric_array(value):
+            data[tag] = shared_array(value)
+
+    return
+
+def is_numeric_array(value):
+
+    return isinstance(value, np.ndarray) and value.dtype != object
+
+def shared_array(values):
+    """Read-only Shared_Array holding values, which are copied only if they are writable."""
+
+    if isinstance(values, Shared_Array) and not values.flags.writeable:
+        return values
+
+    array = np.array(values).view(Shared_Array)
+    array.flags.writeable = False
+
+    return array
+
+# ----------------------------------------------------------------------
+#   Shared Array
+# ----------------------------------------------------------------------
+class Shared_Array(np.ndarray):
+    """ndarray that deepcopy returns as is while it is read-only. Results computed from it,
+    and writable copies of it, are ordinary arrays again."""
+
+    def __deepcopy__(self, memo):
+
+        if self.flags.writeable:
+            return np.array(self)
+
+        return self
+
+    def __array_wrap__(self, array, context = None, return_scalar = False):
+
+        array = np.asarray(array)
+        if return_scalar:
+            return array[()]
+
+        return array
+
+    def __reduce__(self):
+
+        # reloaded arrays are frozen again, and stored once however many copies refer to them
+        if self.flags.writeable:
+            return (np.array, (np.asarray(self),))
+
+        return (shared_array, (np.asarray(self),))
+
+    def copy(self, order = 'C'):
+
+        return np.asarray(self).copy(order)
@@ -14,6 +14,9 @@ from RCAIDE.Library.Methods.Geometry.Planform                                  i
 from RCAIDE.Library.Methods.Weights.Correlation_Buildups.Propulsion            import compute_motor_weight
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor                     import design_motor
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor                        import design_prop_rotor  
+from Rotor_Design_Cache                                                        import design_rotor
+from Shared_Rotor_Data                                                         import share_rotor_data
+from Airfoil_File_Cache                                                        import cached_airfoil_imports
 from RCAIDE.Library.Methods.Weights.Physics_Based_Buildups.Electric            import converge_physics_based_weight_buildup 
 from RCAIDE.Library.Methods.Weights.Moment_of_Inertia                          import compute_aircraft_moment_of_inertia
 from RCAIDE.Library.Methods.Weights.Center_of_Gravity                          import compute_vehicle_center_of_gravity
@@ -32,7 +35,9 @@ import  pickle
 def main():           
          
     # vehicle data  
-    vehicle  = vehicle_setup() 
+    # airfoil files are parsed once and then loaded from the airfoil cache
+    with cached_airfoil_imports():
+        vehicle  = vehicle_setup() 
 
     # Set up configs
     configs  = configs_setup(vehicle)
@@ -475,7 +480,8 @@ def vehicle_setup() :
     prop_rotor.append_airfoil(airfoil)                
     prop_rotor.airfoil_polar_stations             = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]    
     prop_rotor.fidelity                           = "Momentum_Theory"   
-    design_prop_rotor(prop_rotor) 
+    design_rotor(design_prop_rotor, prop_rotor) 
+    share_rotor_data(prop_rotor)
     propulsor.rotor =  prop_rotor 
     
     
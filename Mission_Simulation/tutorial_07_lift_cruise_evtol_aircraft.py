@@ -8,6 +8,9 @@ from RCAIDE.Library.Methods.Weights.Correlation_Buildups.Propulsion            i
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor                     import design_motor
 from RCAIDE.Library.Methods.Performance                                        import estimate_stall_speed
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor                        import design_propeller ,design_lift_rotor 
+from Rotor_Design_Cache                                                        import design_rotor
+from Shared_Rotor_Data                                                         import share_rotor_data
+from Airfoil_File_Cache                                                        import cached_airfoil_imports
 from RCAIDE.Library.Methods.Weights.Physics_Based_Buildups.Electric            import converge_physics_based_weight_buildup
 from RCAIDE.Library.Methods.Weights.Moment_of_Inertia                          import compute_aircraft_moment_of_inertia
 from RCAIDE.Library.Methods.Weights.Center_of_Gravity                          import compute_vehicle_center_of_gravity 
@@ -27,7 +30,9 @@ import  pickle
 def main():           
          
     # vehicle data
-    vehicle  = vehicle_setup()
+    # airfoil files are parsed once and then loaded from the airfoil cache
+    with cached_airfoil_imports():
+        vehicle  = vehicle_setup()
 
     # Set up configs
     configs  = configs_setup(vehicle)
@@ -517,7 +522,8 @@ def vehicle_setup() :
                                                              airfoil_path + 'Airfoils' + separator + 'Polars' + separator + 'NACA_4412_polar_Re_7500000.txt' ]
     propeller.append_airfoil(airfoil)                     
     propeller.airfoil_polar_stations                       = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]  
-    propeller                                              = design_propeller(propeller)   
+    propeller                                              = design_rotor(design_propeller, propeller)   
+    share_rotor_data(propeller)
     cruise_propulsor_1.rotor                               = propeller    
                 
     # Propeller Motor              
@@ -700,7 +706,8 @@ def vehicle_setup() :
                                                               airfoil_path + 'Airfoils' + separator + 'Polars' + separator + 'NACA_4412_polar_Re_7500000.txt' ]
     lift_rotor.append_airfoil(airfoil)                         
     lift_rotor.airfoil_polar_stations                      = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]  
-    design_lift_rotor(lift_rotor)      
+    design_rotor(design_lift_rotor, lift_rotor)      
+    share_rotor_data(lift_rotor)
             
     lift_propulsor_1.rotor =  lift_rotor          
     
@@ -14,6 +14,9 @@ from RCAIDE.Library.Methods.Geometry.Planform                                  i
 from RCAIDE.Library.Methods.Weights.Correlation_Buildups.Propulsion            import compute_motor_weight
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor                     import design_motor 
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor                        import design_prop_rotor , design_lift_rotor
+from Rotor_Design_Cache                                                        import design_rotor
+from Shared_Rotor_Data                                                         import share_rotor_data
+from Airfoil_File_Cache                                                        import cached_airfoil_imports
 from RCAIDE.Library.Methods.Weights.Physics_Based_Buildups.Electric            import converge_physics_based_weight_buildup 
 from RCAIDE.Library.Methods.Weights.Moment_of_Inertia                          import compute_aircraft_moment_of_inertia
 from RCAIDE.Library.Methods.Weights.Center_of_Gravity                          import compute_vehicle_center_of_gravity
@@ -21,6 +24,8 @@ from RCAIDE.Library.Plots                                                      i
 from RCAIDE import  load 
 from RCAIDE import  save  
 
+from Segment_Solvers import adaptive_converge
+
 import os
 import numpy as np 
 from copy import deepcopy
@@ -32,7 +37,9 @@ import  pickle
 def main():           
          
     # vehicle data  
-    vehicle  = vehicle_setup()
+    # airfoil files are parsed once and then loaded from the airfoil cache
+    with cached_airfoil_imports():
+        vehicle  = vehicle_setup()
     
     # Set up configs
     configs  = configs_setup(vehicle)
@@ -604,7 +611,8 @@ def vehicle_setup() :
     prop_rotor.airfoil_polar_stations             = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]    
     prop_rotor.fidelity                           = "Momentum_Theory"  
      
-    design_prop_rotor(prop_rotor) 
+    design_rotor(design_prop_rotor, prop_rotor) 
+    share_rotor_data(prop_rotor)
         
     front_propulsor.rotor =  prop_rotor 
     
@@ -736,7 +744,8 @@ def vehicle_setup() :
     lift_rotor.append_airfoil(airfoil)                         
     lift_rotor.airfoil_polar_stations                      = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]  
      
-    design_lift_rotor(lift_rotor)         
+    design_rotor(design_lift_rotor, lift_rotor)         
+    share_rotor_data(lift_rotor)
             
     lift_propulsor.rotor =  lift_rotor          
     
@@ -976,6 +985,9 @@ def mission_setup(analyses):
     base_segment = Segments.Segment()
     base_segment.state.numerics.number_of_control_points    = number_of_cpts
     
+    # set to True to double the control points of a segment until its solution is resolved
+    base_segment.state.numerics.adaptive_control_points     = False
+    
 
     # ------------------------------------------------------------------
     #   Mission Constants
@@ -1214,7 +1226,9 @@ def mission_setup(analyses):
                                                                          'lift_rotor_propulsor_4', 'lift_rotor_propulsor_5', 'lift_rotor_propulsor_6']]
        
     mission.append_segment(segment)  
-    
+
+    for segment in mission.segments:
+        segment.process.converge = adaptive_converge(segment.process.converge)
     
     return mission 
  
@@ -15,6 +15,9 @@ from RCAIDE.Library.Methods.Weights.Correlation_Buildups.Propulsion            i
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor                     import design_motor
 from RCAIDE.Library.Methods.Performance                                        import estimate_stall_speed
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor                        import design_prop_rotor , design_lift_rotor
+from Rotor_Design_Cache                                                        import design_rotor
+from Shared_Rotor_Data                                                         import share_rotor_data
+from Airfoil_File_Cache                                                        import cached_airfoil_imports
 from RCAIDE.Library.Methods.Weights.Physics_Based_Buildups.Electric            import converge_physics_based_weight_buildup 
 from RCAIDE.Library.Methods.Weights.Moment_of_Inertia                          import compute_aircraft_moment_of_inertia
 from RCAIDE.Library.Methods.Weights.Center_of_Gravity                          import compute_vehicle_center_of_gravity
@@ -22,6 +25,8 @@ from RCAIDE.Library.Plots                                                      i
 from RCAIDE import  load 
 from RCAIDE import  save  
 
+from Segment_Solvers import converge_sparse_newton, converge_colored_newton
+
 import os
 import numpy as np 
 from copy import deepcopy
@@ -36,7 +41,9 @@ def main():
     new_geometry    = True
     redesign_rotors = False  
     if new_geometry :
-        vehicle  = vehicle_setup(redesign_rotors)
+        # airfoil files are parsed once and then loaded from the airfoil cache
+        with cached_airfoil_imports():
+            vehicle  = vehicle_setup(redesign_rotors)
         save_aircraft_geometry(vehicle , 'Tilt_Stopped_Rotor_Conv_Tail')
     else: 
         vehicle = load_aircraft_geometry('Tilt_Stopped_Rotor_Conv_Tail')
@@ -682,7 +689,8 @@ def vehicle_setup(redesign_rotors=True) :
     prop_rotor.append_airfoil(airfoil)                
     prop_rotor.airfoil_polar_stations             = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]    
     prop_rotor.fidelity                           = "Momentum_Theory"   
-    design_prop_rotor(prop_rotor) 
+    design_rotor(design_prop_rotor, prop_rotor) 
+    share_rotor_data(prop_rotor)
     front_propulsor.rotor =  prop_rotor 
     
     
@@ -812,7 +820,8 @@ def vehicle_setup(redesign_rotors=True) :
                                                               airfoil_path + 'Airfoils' + separator + 'Polars' + separator + 'NACA_4412_polar_Re_7500000.txt' ]
     lift_rotor.append_airfoil(airfoil)                         
     lift_rotor.airfoil_polar_stations                      = [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0] 
-    design_lift_rotor(lift_rotor) 
+    design_rotor(design_lift_rotor, lift_rotor) 
+    share_rotor_data(lift_rotor)
     lift_propulsor.rotor =  lift_rotor          
     
     #------------------------------------------------------------------------------------------------------------------------------------               
@@ -1318,6 +1327,15 @@ def mission_setup(analyses):
        
     mission.append_segment(segment)  
     '''
+
+    # the 6-DOF segments carry the most unknowns per control point, solve them with the
+    # sparse finite-difference Newton solver. The segments trimmed in pitch have a sparse
+    # Jacobian as well, whose structure is detected on the first solve and reused after
+    for segment in mission.segments:
+        if segment.flight_dynamics.moment_x:
+            segment.process.converge = converge_sparse_newton
+        elif segment.flight_dynamics.moment_y:
+            segment.process.converge = converge_colored_newton
    
     return mission 
 
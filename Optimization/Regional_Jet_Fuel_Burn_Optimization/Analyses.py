@@ -3,6 +3,9 @@ from RCAIDE.Framework.Core import Units
 
 import numpy as np
 
+from Cached_Aerodynamics import Cached_Vortex_Lattice_Method
+from Fast_Atmosphere import Fast_US_Standard_1976
+
 # ----------------------------------------------------------------------        
 #   Setup Analyses
 # ----------------------------------------------------------------------  
@@ -37,7 +40,8 @@ def base(vehicle):
 
     # ------------------------------------------------------------------
     #  Aerodynamics Analysis
-    aerodynamics = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    # the trained surrogates are reused across runs while the geometry is unchanged
+    aerodynamics = Cached_Vortex_Lattice_Method()
     aerodynamics.vehicle = vehicle
     aerodynamics.settings.number_of_spanwise_vortices   = 5
     aerodynamics.settings.number_of_chordwise_vortices  = 2   
@@ -56,7 +60,7 @@ def base(vehicle):
 
     # ------------------------------------------------------------------
     #  Atmosphere Analysis
-    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere = Fast_US_Standard_1976()
     atmosphere.features.planet = planet.features
     analyses.append(atmosphere)   
 
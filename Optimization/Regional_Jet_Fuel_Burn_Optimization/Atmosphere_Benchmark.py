@@ -0,0 +1,86 @@
+# Atmosphere_Benchmark.py
+#
+# Times US_Standard_1976.compute_values against the vectorized Fast_US_Standard_1976 of this
+# optimization, exact and tabulated, on a million altitudes and on the 16 point columns a
+# mission segment passes at every residual evaluation. The altitudes lie in the 0-15 km band
+# of the default table. The largest relative difference of every property is reported for the
+# large case, next to the error bound the table measured when it was built.
+#
+# Usage:
+#   python Atmosphere_Benchmark.py               one million altitudes, best of 5 repeats
+#   python Atmosphere_Benchmark.py 100000 10     altitudes, repeats
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import time
+
+import numpy as np
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+
+from Fast_Atmosphere import Fast_US_Standard_1976
+
+properties = ['pressure', 'temperature', 'density', 'speed_of_sound', 'dynamic_viscosity',
+              'kinematic_viscosity', 'thermal_conductivity', 'prandtl_number']
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    points  = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    # column of altitudes, as segments pass them, inside the model's range
+    rng      = np.random.default_rng(0)
+    altitude = rng.uniform(0., 15., (points, 1)) * Units.km
+
+    reference           = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    exact               = Fast_US_Standard_1976()
+    tabulated           = Fast_US_Standard_1976()
+    tabulated.tabulated = True
+    models              = [('exact', exact), ('tabulated', tabulated)]
+
+    reference_time, reference_values = best_time(reference, altitude, repeats)
+    print('{} altitudes, best of {}'.format(points, repeats))
+    print('{:25s} {:10.4f} s'.format('US_Standard_1976', reference_time))
+    for tag, model in models:
+        model_time, values = best_time(model, altitude, repeats)
+        print('{:25s} {:10.4f} s   {:6.1f}x'.format(tag, model_time, reference_time / model_time))
+        for name in properties:
+            error = np.max(np.abs(values[name] / reference_values[name] - 1.))
+            line  = '  {:22s} max relative difference {:.2e}'.format(name, error)
+            if model is tabulated:
+                line += ', table bound {:.2e}'.format(tabulated.property_tables[0.].maximum_error[name])
+            print(line)
+
+    # per call overhead dominates for segment sized inputs
+    column = np.linspace(0., 11., 16)[:, None] * Units.km
+    calls  = 10000
+    reference_time = best_time(reference, column, repeats, calls)[0] / calls
+    print('16 altitudes, {} calls'.format(calls))
+    print('{:25s} {:10.2f} us'.format('US_Standard_1976', reference_time * 1E6))
+    for tag, model in models:
+        model_time = best_time(model, column, repeats, calls)[0] / calls
+        print('{:25s} {:10.2f} us   {:6.1f}x'.format(tag, model_time * 1E6, reference_time / model_time))
+
+    return
+
+def best_time(atmosphere, altitude, repeats, calls = 1):
+
+    atmosphere.compute_values(altitude[:10])
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            values = atmosphere.compute_values(altitude)
+        times.append(time.perf_counter() - start)
+
+    return min(times), values
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# Cached_Aerodynamics.py
+#
+# Vortex lattice aerodynamics whose trained surrogates are kept in a persistent on-disk cache.
+# The cache is keyed by a stable hash of the wing and fuselage geometry, the vehicle reference
+# area and center of gravity and the analysis settings, so repeated runs and optimizer
+# iterations that leave these unchanged skip the surrogate build entirely. Entries are pickles
+# in the user cache folder and are only loaded from a folder no other user can write to.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+
+from copy import deepcopy
+import hashlib
+
+from Data_Hash import update_hash, user_cache_directory, load_pickle, save_pickle
+
+# trained analyses already loaded in this process, by geometry hash
+_memory_cache = {}
+
+# ----------------------------------------------------------------------
+#   Cached Vortex Lattice Method
+# ----------------------------------------------------------------------
+class Cached_Vortex_Lattice_Method(RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method):
+    """Vortex_Lattice_Method that restores its initialized state (influence data, training
+    tables and surrogates) from disk when an analysis with the same geometry and settings has
+    been initialized before. cache_directory defaults to a folder in the user cache."""
+
+    def __defaults__(self):
+
+        self.cache_directory = user_cache_directory('aerodynamics_cache')
+
+    def initialize(self):
+
+        key = geometry_hash(self.vehicle, self.settings)
+
+        if key not in _memory_cache:
+            state = load_pickle(self.cache_directory, key)
+            if state is None:
+                super().initialize()
+                _memory_cache[key] = deepcopy(initialized_state(self))
+                save_pickle(self.cache_directory, key, _memory_cache[key])
+                return
+            _memory_cache[key] = state
+
+        # each analysis gets its own copy, so settings or tables changed on one are not changed
+        # on every other analysis restored from the same entry
+        for tag, value in _memory_cache[key].items():
+            self[tag] = deepcopy(value)
+
+        return
+
+def initialized_state(analysis):
+    """Everything the analysis holds after initialize, except the vehicle it is attached to."""
+
+    state = Data()
+    for tag, value in analysis.items():
+        if tag not in ['vehicle', 'cache_directory']:
+            state[tag] = value
+
+    return state
+
+# ----------------------------------------------------------------------
+#   Geometry Hash
+# ----------------------------------------------------------------------
+def geometry_hash(vehicle, settings):
+    """Stable hash of the wings, fuselages, vehicle reference area and center of gravity and
+    of the analysis settings. The mass properties of the wings and fuselages are left out
+    since the weights analysis updates them without changing the geometry, and referenced
+    files such as airfoil coordinates are hashed by content."""
+
+    digest = hashlib.sha1()
+    digest.update(str(getattr(RCAIDE, '__version__', '')).encode())
+    update_hash(digest, vehicle.reference_area)
+    update_hash(digest, vehicle.mass_properties.center_of_gravity)
+    update_hash(digest, vehicle.wings, exclude = ['mass_properties'])
+    update_hash(digest, vehicle.fuselages, exclude = ['mass_properties'])
+    update_hash(digest, settings)
+
+    return digest.hexdigest()
@@ -0,0 +1,221 @@
+# Fast_Atmosphere.py
+#
+# U.S. Standard Atmosphere (1976) evaluated without a loop over the layers. The base of each
+# layer, its lapse rate and the coefficients of its pressure law are tabulated once from the
+# break points of the model, and compute_values looks up the layer of every altitude with a
+# single searchsorted before evaluating temperature and pressure with one expression that holds
+# for both the isothermal and the gradient layers. The Prandtl number is formed from the
+# viscosity and conductivity already computed instead of evaluating both a second time.
+#
+# In tabulated mode every property is instead interpolated linearly from a dense table over
+# the altitude band of the missions, built once per temperature deviation. The table is uniform
+# in geopotential altitude, so the cell of an altitude is found by a multiplication instead of
+# a search, and the layer breaks fall on table points. When a table is built its error is
+# measured against US_Standard_1976 halfway between the table points, where it is largest.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Framework.Mission.Common import Conditions
+from RCAIDE.Library.Attributes.Gases import Air
+from RCAIDE.Library.Attributes.Planets import Earth
+
+import numpy as np
+from warnings import warn
+
+# properties returned by compute_values, in the column order of the property tables
+tabulated_properties = ['pressure', 'temperature', 'density', 'speed_of_sound', 'dynamic_viscosity',
+                        'kinematic_viscosity', 'thermal_conductivity', 'prandtl_number']
+
+# ----------------------------------------------------------------------
+#   Fast US Standard 1976
+# ----------------------------------------------------------------------
+class Fast_US_Standard_1976(RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976):
+    """US_Standard_1976 with a vectorized compute_values. Altitudes may be scalars or arrays
+    of any shape; the returned properties have the shape of the altitude array. The layer
+    table is built on the first call, so the break points, gas and planet must be set before;
+    the warnings US_Standard_1976 gives for a gas other than Air or a planet other than Earth
+    are given once, when the table is built.
+
+    With tabulated set, altitudes inside table_altitude_range are interpolated from a table
+    with points every table_spacing (geopotential) and a scalar temperature deviation. Calls
+    with altitudes outside the range or an array of deviations use the exact evaluation."""
+
+    def __defaults__(self):
+
+        self.layer_table           = None
+        self.tabulated             = False
+        self.table_altitude_range  = [0., 15000.]
+        self.table_spacing         = 5.
+        self.table_tolerance       = 1E-5
+        self.property_tables       = {}
+
+    def compute_layer_table(self):
+        """Per layer: base altitude, base temperature, base pressure, lapse rate and the pressure
+        law written as  p = p0 * exp(A*dz + E*log(1 - C*dz)).  Gradient layers have A = 0 and
+        isothermal layers have C = E = 0, so no layer needs a branch of its own."""
+
+        if not self.fluid_properties == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')
+
+        breaks = self.breaks
+        grav   = self.planet.sea_level_gravity
+        R      = self.fluid_properties.gas_specific_constant
+
+        z0    = np.array(breaks.altitude[:-1], dtype = float)
+        T0    = np.array(breaks.temperature[:-1], dtype = float)
+        alpha = -np.diff(breaks.temperature) / np.diff(breaks.altitude)
+        isothermal = alpha == 0.
+        gradient   = np.where(isothermal, 1., alpha)
+
+        table             = Data()
+        table.altitude    = np.array(breaks.altitude, dtype = float)
+        table.z0          = z0
+        table.T0          = T0
+        table.p0          = np.array(breaks.pressure[:-1], dtype = float)
+        table.alpha       = alpha
+        table.A           = np.where(isothermal, -grav / (R * T0), 0.)
+        table.C           = np.where(isothermal, 0., alpha / T0)
+        table.E           = np.where(isothermal, 0., grav / (gradient * R))
+        table.mean_radius = self.planet.mean_radius
+
+        self.layer_table = table
+
+        return table
+
+    def compute_values(self, altitude, temperature_deviation = 0.0):
+
+        if self.tabulated and np.ndim(temperature_deviation) == 0:
+            zs    = np.asarray(altitude, dtype = float)
+            zs    = zs / (1. + zs / self.planet.mean_radius)
+            lower = self.table_altitude_range[0] / (1. + self.table_altitude_range[0] / self.planet.mean_radius)
+            upper = self.table_altitude_range[1] / (1. + self.table_altitude_range[1] / self.planet.mean_radius)
+            if zs.size and np.min(zs) >= lower and np.max(zs) <= upper:
+                return self.interpolate_values(zs, float(temperature_deviation))
+
+        return self.compute_exact_values(altitude, temperature_deviation)
+
+    def compute_exact_values(self, altitude, temperature_deviation = 0.0):
+
+        table = self.layer_table
+        if table is None:
+            table = self.compute_layer_table()
+        gas = self.fluid_properties
+
+        # convert geometric to geopotential altitude
+        zs = np.atleast_1d(np.asarray(altitude, dtype = float))
+        zs = zs / (1. + zs / table.mean_radius)
+
+        # one deviation per row of a column of altitudes, not a (n, n) grid of both
+        temperature_deviation = np.asarray(temperature_deviation, dtype = float)
+        if temperature_deviation.ndim == 1 and zs.ndim > 1:
+            temperature_deviation = temperature_deviation.reshape((-1,) + (1,) * (zs.ndim - 1))
+
+        if np.any(zs > table.altitude[-1]):
+            warn('Altitude too high, setting to upper limit', stacklevel = 2)
+        if np.any(zs < table.altitude[0]):
+            warn('Altitude too low, setting to lower limit', stacklevel = 2)
+        zs = np.clip(zs, table.altitude[0], table.altitude[-1])
+
+        # an altitude on a break belongs to the layer above it, as in US_Standard_1976
+        layer = np.minimum(np.searchsorted(table.altitude, zs, side = 'right') - 1, len(table.z0) - 1)
+        dz    = zs - table.z0[layer]
+
+        p   = table.p0[layer] * np.exp(table.A[layer] * dz + table.E[layer] * np.log1p(-table.C[layer] * dz))
+        T   = table.T0[layer] - table.alpha[layer] * dz + temperature_deviation
+        rho = gas.compute_density(T, p)
+        mu  = gas.compute_absolute_viscosity(T)
+        K   = gas.compute_thermal_conductivity(T)
+
+        atmo_data = Conditions()
+        atmo_data.expand_rows(zs.shape[0])
+        atmo_data.pressure             = p
+        atmo_data.temperature          = T
+        atmo_data.density              = rho
+        atmo_data.speed_of_sound       = gas.compute_speed_of_sound(T)
+        atmo_data.dynamic_viscosity    = mu
+        atmo_data.kinematic_viscosity  = mu / rho
+        atmo_data.thermal_conductivity = K
+        atmo_data.prandtl_number       = gas.specific_heat_capacity * mu / K
+
+        return atmo_data
+
+    # ------------------------------------------------------------------
+    #   Tabulated Mode
+    # ------------------------------------------------------------------
+    def compute_property_table(self, temperature_deviation):
+        """Every property at the table points and its slope from each point to the next."""
+
+        Rad   = self.planet.mean_radius
+        lower = self.table_altitude_range[0] / (1. + self.table_altitude_range[0] / Rad)
+        upper = self.table_altitude_range[1] / (1. + self.table_altitude_range[1] / Rad)
+
+        # start on a multiple of the spacing so the layer breaks fall on table points
+        start  = np.floor(lower / self.table_spacing) * self.table_spacing
+        points = int(np.ceil((upper - start) / self.table_spacing)) + 1
+        zs     = start + self.table_spacing * np.arange(points)
+
+        # geopotential back to geometric altitude for the exact evaluation
+        values = self.compute_exact_values(zs / (1. - zs / Rad), temperature_deviation)
+
+        table                 = Data()
+        table.start           = start
+        table.inverse_spacing = 1. / self.table_spacing
+        table.cells           = points - 1
+        table.points          = Data()
+        table.slopes          = Data()
+        for name in tabulated_properties:
+            table.points[name] = np.ravel(values[name])
+            table.slopes[name] = np.diff(table.points[name])
+        table.maximum_error = self.table_error(table, zs, temperature_deviation)
+
+        worst = max(table.maximum_error.keys(), key = lambda name: table.maximum_error[name])
+        if table.maximum_error[worst] > self.table_tolerance:
+            warn('Atmosphere table {} error {:.1e} exceeds the tolerance, reduce table_spacing'.format(
+                worst, table.maximum_error[worst]), stacklevel = 3)
+
+        self.property_tables[temperature_deviation] = table
+
+        return table
+
+    def table_error(self, table, zs, temperature_deviation):
+        """Largest relative difference of each property between the table and
+        US_Standard_1976. The interpolation error peaks halfway between the table points, and
+        the pressure of the model itself jumps slightly at its layer breaks, which the table
+        spreads over the cell below the break, so both places are checked."""
+
+        fractions = np.array([0.5, 1. - 1E-6])
+        checks    = (zs[:-1, None] + self.table_spacing * fractions).ravel()
+        exact     = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976.compute_values(
+            self, checks / (1. - checks / self.planet.mean_radius), temperature_deviation)
+
+        maximum_error = Data()
+        for name in tabulated_properties:
+            values = (table.points[name][:-1, None] + fractions * table.slopes[name][:, None]).ravel()
+            maximum_error[name] = float(np.max(np.abs(values / np.ravel(exact[name]) - 1.)))
+
+        return maximum_error
+
+    def interpolate_values(self, zs, temperature_deviation):
+        """Linear interpolation of every property at the geopotential altitudes zs."""
+
+        table = self.property_tables.get(temperature_deviation)
+        if table is None:
+            table = self.compute_property_table(temperature_deviation)
+
+        shape    = np.shape(np.atleast_1d(zs))
+        position = (np.ravel(zs) - table.start) * table.inverse_spacing
+        cell     = np.minimum(position.astype(np.intp), table.cells - 1)
+        weight   = position - cell
+
+        atmo_data = Conditions()
+        atmo_data.expand_rows(shape[0])
+        for name in tabulated_properties:
+            atmo_data[name] = (table.points[name].take(cell) + weight * table.slopes[name].take(cell)).reshape(shape)
+
+        return atmo_data
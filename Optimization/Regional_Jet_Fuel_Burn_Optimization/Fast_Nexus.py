@@ -0,0 +1,753 @@
+# Fast_Nexus.py
+#
+# Nexus that evaluates the objective and every constraint in one pass per design point, keeps
+# the outputs of recent points in a bounded cache and in an on-disk history, and computes
+# finite-difference gradients on a pool of worker processes that lives as long as the
+# optimization, or adjoint gradients from the Jacobians of the mission solves. SLSQP_Solve runs
+# the same optimization as scipy_setup.SciPy_Solve(problem, solver = 'SLSQP'), but hands these
+# gradients to SciPy instead of letting it perturb the inputs one after the other.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Framework.Optimization.Common import Nexus
+from RCAIDE.Framework.Analyses.Process import Process
+
+import numpy as np
+import scipy as sp
+import scipy.optimize
+import multiprocessing
+import inspect
+import sqlite3
+import pickle
+import json
+import time
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+
+from Data_Hash import data_hash
+from Mission_Adjoint import mission_adjoint, adjoint_correction, held_unknowns, perturb_handed_over
+
+# copy of the nexus a worker process evaluates, set when the worker starts
+_worker = Data()
+
+# ----------------------------------------------------------------------
+#   Fast Nexus
+# ----------------------------------------------------------------------
+class Fast_Nexus(Nexus):
+    """Nexus whose objective, constraints and their gradients at a design point all come from
+    the same procedure evaluation. The perturbed points of a gradient are spread over
+    max_workers processes, so a gradient costs about one evaluation per worker rather than
+    one per design variable. The worker processes are started on the first parallel
+    evaluation, forked where the platform can and spawned otherwise, and are kept until
+    optimizer_evaluations exits or shutdown_workers is called. Every point sent to them
+    carries the warm start of the missions here, so it is solved from the same initial guess
+    it would be solved from in this process.
+
+    Outputs are cached by the scaled input vector rounded to cache_decimals, keeping the
+    cache_size most recently used points. A cache hit also restores the summary of the point,
+    without re-running the procedure.
+
+    When history_file is set every evaluated point is appended to an SQLite database, and points
+    already in the database are replayed from it, so a restarted optimization runs up to where
+    the previous one stopped without solving a mission. Points are stored with a signature of
+    the problem definition, the vehicle configurations and the source files listed in
+    history_sources and defining the procedure steps, and only replayed under the same one.
+
+    Cached and replayed outputs leave the results of whichever point was solved last on the
+    nexus. They are only returned as they are inside optimizer_evaluations, which the solvers
+    use; any other call at a point whose results are not on the nexus solves it again, so the
+    results and summary read after an optimization belong to the point asked for.
+
+    step_inputs declares, by the dotted name of a procedure step, the tags of the inputs its
+    results depend on, directly or through the steps before it. A declared step is skipped,
+    keeping what it left on the nexus, when none of those inputs changed since it last ran in
+    this process. Steps that are not declared always run. While the workers solve the other
+    perturbed points of a gradient, this process solves the first one, right after the point
+    it perturbs, so the steps that do not depend on the perturbed input are skipped.
+
+    With gradient_method 'adjoint', the gradients come from the adjoint of the mission solves
+    instead, see adjoint_derivatives. Every mission segment then has to be converged with
+    Mission_Adjoint.converge_newton, and adjoint_steps names the procedure steps that compute
+    the outputs from the mission results."""
+
+    def __defaults__(self):
+
+        self.max_workers            = None
+        self.executor               = None
+        self.finite_difference_step = 1.4901161193847656e-08
+        self.gradient_method        = 'finite_difference'
+        self.adjoint_steps          = []
+        self.cache_size             = 128
+        self.cache_decimals         = 12
+        self.cache_hits             = 0
+        self.cache_misses           = 0
+        self.evaluation_cache       = OrderedDict()
+        self.last_gradients         = None
+        self.history_file           = None
+        self.history_replays        = 0
+        self.history_connection     = None
+        self.history_sources        = []
+        self.history_signature      = None
+        self.results_key            = None
+        self.optimizing             = False
+        self.step_inputs            = {}
+        self.skipped_steps          = 0
+        self.steps_instrumented     = False
+        self.compiled_aliases       = None
+
+    # ------------------------------------------------------------------
+    #   Outputs at a point
+    # ------------------------------------------------------------------
+    def objective(self, x = None):
+
+        return self.evaluate_outputs(x).objective
+
+    def all_constraints(self, x = None):
+
+        return self.evaluate_outputs(x).all_constraints
+
+    def inequality_constraint(self, x = None):
+
+        return self.evaluate_outputs(x).inequality_constraint
+
+    def equality_constraint(self, x = None):
+
+        return self.evaluate_outputs(x).equality_constraint
+
+    def evaluate_outputs(self, x = None):
+        """Outputs at x from the cache, the history or a new run of the procedure."""
+
+        key             = input_key(self, x)
+        outputs, source = self.find_outputs(key)
+        if outputs is not None and (self.optimizing or key == self.results_key):
+            self.count_reuse(source)
+            self.summary = deepcopy(outputs.summary)
+            return outputs
+
+        self.cache_misses += 1
+        if outputs is not None:
+            # known point whose results are not on the nexus: solve it again, already stored
+            outputs = self.compute_outputs(x)
+            self.cache_outputs(key, outputs)
+            return outputs
+
+        outputs = self.compute_outputs(x)
+        self.store_outputs(key, outputs, x)
+
+        return outputs
+
+    @contextmanager
+    def optimizer_evaluations(self):
+        """Context in which cached and replayed outputs are returned without solving the point
+        again, for evaluations whose results only the optimizer reads. The worker processes are
+        shut down when the outermost context exits."""
+
+        optimizing      = self.optimizing
+        self.optimizing = True
+        try:
+            yield self
+        finally:
+            self.optimizing = optimizing
+            if not optimizing:
+                self.shutdown_workers()
+
+        return
+
+    def compute_outputs(self, x = None):
+        """Runs the procedure once at x and gathers every output the optimizer asks for."""
+
+        if self.step_inputs and not self.steps_instrumented:
+            self.instrument_procedure()
+
+        start = time.time()
+        self.evaluate(x)
+        self.results_key = input_key(self, x)
+
+        outputs                 = self.gather_outputs()
+        outputs.evaluation_time = time.time() - start
+
+        return outputs
+
+    def gather_outputs(self):
+        """Scaled objective and constraints of the values the procedure left on the nexus."""
+
+        aliases     = self.compile_aliases()
+        objective   = self.optimization_problem.objective
+        constraints = self.optimization_problem.constraints
+
+        objective_values  = np.array([accessor.get(self) for accessor in aliases.objective], dtype = float)
+        constraint_values = np.array([accessor.get(self) for accessor in aliases.constraints], dtype = float)
+        senses            = np.array(constraints[:,1], dtype = str) if len(constraints) else np.array([], dtype = str)
+        scaling           = np.array(constraints[:,3], dtype = float) if len(constraints) else np.ones(0)
+
+        # scaled as by RCAIDE's Nexus: the aliased values are in SI units, the edges and the
+        # objective are given in the units of their last column
+        edges = np.array(constraints[:,2] * constraints[:,4], dtype = float) if len(constraints) else np.zeros(0)
+
+        # constraints in the g(x) >= 0 form the optimizers expect
+        bounded = np.where(senses == '<', edges - constraint_values, constraint_values - edges) / scaling
+
+        outputs                       = Data()
+        outputs.objective             = objective_values / np.array(objective[:,1] * objective[:,2], dtype = float)
+        outputs.all_constraints       = constraint_values / scaling
+        outputs.inequality_constraint = bounded[senses != '=']
+        outputs.equality_constraint   = bounded[senses == '=']
+        outputs.summary               = deepcopy(self.summary)
+
+        return outputs
+
+    # ------------------------------------------------------------------
+    #   Compiled Aliases
+    # ------------------------------------------------------------------
+    def unpack_inputs(self, x = None):
+        """Writes the scaled inputs x, or the current inputs without x, to every aliased path.
+        The values are inputs * scaling * units, as set up by SLSQP_Solve."""
+
+        inputs = self.optimization_problem.inputs
+        if x is not None:
+            inputs[:,1] = np.array(x, dtype = float) * np.array(inputs[:,4], dtype = float)
+
+        values = np.array(inputs[:,1], dtype = float) * np.array(inputs[:,5], dtype = float)
+        for accessors, value in zip(self.compile_aliases().inputs, values):
+            for accessor in accessors:
+                accessor.set(self, value)
+
+        return self
+
+    def compile_aliases(self):
+        """Resolves the alias of every input, objective and constraint once, with wildcards
+        expanded against the configurations present at that time. Reset compiled_aliases to
+        None after changing the problem or adding configurations."""
+
+        if self.compiled_aliases is not None:
+            return self.compiled_aliases
+
+        problem = self.optimization_problem
+        aliases = dict((tag, [alias] if isinstance(alias, str) else list(alias)) for tag, alias in problem.aliases)
+
+        def accessors(tag):
+            return [Alias_Accessor(path) for alias in aliases[tag] for path in expand_alias_path(self, alias)]
+
+        compiled             = Data()
+        compiled.inputs      = [accessors(tag) for tag in problem.inputs[:,0]]
+        compiled.objective   = [accessors(tag)[0] for tag in problem.objective[:,0]]
+        compiled.constraints = [accessors(tag)[0] for tag in problem.constraints[:,0]]
+        self.compiled_aliases = compiled
+
+        return compiled
+
+    def find_outputs(self, key):
+        """Stored outputs at key and where they were found, 'cache' or 'history', or None twice.
+        Nothing is counted here: a caller counts a hit with count_reuse only when it returns the
+        stored outputs, and a miss when it solves the point."""
+
+        if key in self.evaluation_cache:
+            self.evaluation_cache.move_to_end(key)
+            return self.evaluation_cache[key], 'cache'
+
+        outputs = self.read_history(key)
+        if outputs is not None:
+            self.cache_outputs(key, outputs)
+            return outputs, 'history'
+
+        return None, None
+
+    def count_reuse(self, source):
+
+        if source == 'cache':
+            self.cache_hits += 1
+        else:
+            self.history_replays += 1
+
+        return
+
+    def store_outputs(self, key, outputs, x):
+
+        self.cache_outputs(key, outputs)
+        self.write_history(key, outputs, x)
+
+        return
+
+    def cache_outputs(self, key, outputs):
+
+        self.evaluation_cache[key] = outputs
+        self.evaluation_cache.move_to_end(key)
+        while len(self.evaluation_cache) > self.cache_size:
+            self.evaluation_cache.popitem(last = False)
+
+        return
+
+    # ------------------------------------------------------------------
+    #   History
+    # ------------------------------------------------------------------
+    def open_history(self):
+        """Connection to the history database, opened on first use. The signature of the problem
+        is taken at that time, before the procedure has changed the vehicle configurations."""
+
+        if self.history_connection is None and self.history_file is not None:
+            self.history_signature  = self.problem_signature()
+            self.history_connection = sqlite3.connect(self.history_file)
+            self.history_connection.execute('''CREATE TABLE IF NOT EXISTS evaluations (
+                                                   id                    INTEGER PRIMARY KEY AUTOINCREMENT,
+                                                   signature             TEXT,
+                                                   key                   TEXT,
+                                                   inputs                TEXT,
+                                                   objective             TEXT,
+                                                   all_constraints       TEXT,
+                                                   inequality_constraint TEXT,
+                                                   equality_constraint   TEXT,
+                                                   summary               BLOB,
+                                                   evaluation_time       REAL,
+                                                   timestamp             TEXT)''')
+
+            # histories written before signatures were stored are kept, but never replayed
+            columns = [row[1] for row in self.history_connection.execute('PRAGMA table_info(evaluations)')]
+            if 'signature' not in columns:
+                self.history_connection.execute('ALTER TABLE evaluations ADD COLUMN signature TEXT')
+            self.history_connection.execute('CREATE INDEX IF NOT EXISTS evaluation_signatures ON evaluations (signature, key)')
+            self.history_connection.commit()
+
+        return self.history_connection
+
+    def problem_signature(self):
+        """Hash of what the outputs of a point depend on besides its inputs: the problem without
+        the current input values, the vehicle configurations, and the content of the files in
+        history_sources and of the modules defining the procedure steps."""
+
+        problem = self.optimization_problem
+        sources = [os.path.abspath(source) for source in self.history_sources]
+        for name, process, tag in procedure_steps(self.procedure):
+            step = getattr(process[tag], '__wrapped__', process[tag])
+            try:
+                sources.append(os.path.abspath(inspect.getsourcefile(step)))
+            except TypeError:
+                pass
+
+        inputs = [[row[0]] + list(row[2:]) for row in problem.inputs]
+
+        return data_hash(inputs, problem.objective.tolist(), problem.constraints.tolist(),
+                         [list(alias) for alias in problem.aliases], self.vehicle_configurations,
+                         sorted(set(sources)))
+
+    def read_history(self, key):
+
+        connection = self.open_history()
+        if connection is None:
+            return None
+
+        row = connection.execute('SELECT ' + ', '.join(history_columns) + ' FROM evaluations WHERE signature = ? AND key = ? ORDER BY id DESC LIMIT 1',
+                                 (self.history_signature, json.dumps(list(key)))).fetchone()
+
+        return None if row is None else history_outputs(row)
+
+    def write_history(self, key, outputs, x):
+        """Each point is committed on its own, so a crash loses at most the point being solved."""
+
+        connection = self.open_history()
+        if connection is None:
+            return
+
+        if x is None:
+            inputs = self.optimization_problem.inputs
+            x      = inputs[:,1] / inputs[:,4]
+
+        connection.execute('INSERT INTO evaluations (signature, key, inputs, ' + ', '.join(history_columns) + ', timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                           (self.history_signature,
+                            json.dumps(list(key)),
+                            json.dumps(np.array(x, dtype = float).ravel().tolist()),
+                            json.dumps(np.atleast_1d(outputs.objective).astype(float).tolist()),
+                            json.dumps(np.atleast_1d(outputs.all_constraints).astype(float).tolist()),
+                            json.dumps(outputs.inequality_constraint.tolist()),
+                            json.dumps(outputs.equality_constraint.tolist()),
+                            pickle.dumps(outputs.summary),
+                            outputs.evaluation_time,
+                            time.strftime('%Y-%m-%dT%H:%M:%S')))
+        connection.commit()
+
+        return
+
+    # ------------------------------------------------------------------
+    #   Partial Re-evaluation of the Procedure
+    # ------------------------------------------------------------------
+    def instrument_procedure(self):
+        """Wraps every step named in step_inputs in a Declared_Step."""
+
+        tags  = list(self.optimization_problem.inputs[:,0])
+        steps = dict((name, (process, tag)) for name, process, tag in procedure_steps(self.procedure))
+        for name, inputs in self.step_inputs.items():
+            if name not in steps:
+                raise ValueError('step_inputs names ' + name + ', which is not a step of the procedure')
+            unknown = [tag for tag in inputs if tag not in tags]
+            if unknown:
+                raise ValueError('step ' + name + ' is declared to depend on unknown inputs ' + ', '.join(unknown))
+            process, tag = steps[name]
+            process[tag] = Declared_Step(process[tag], [tags.index(tag) for tag in inputs])
+        self.steps_instrumented = True
+
+        return
+
+    # ------------------------------------------------------------------
+    #   Gradients
+    # ------------------------------------------------------------------
+    def objective_gradient(self, x):
+
+        return self.evaluate_gradients(x).objective
+
+    def inequality_constraint_gradient(self, x):
+
+        return self.evaluate_gradients(x).inequality_constraint
+
+    def equality_constraint_gradient(self, x):
+
+        return self.evaluate_gradients(x).equality_constraint
+
+    def evaluate_gradients(self, x):
+        """Gradients of the objective and of the inequality and equality constraints, by
+        forward differences or by the adjoint of the mission solves. The perturbed points of
+        the forward differences are evaluated in parallel. All three gradients are kept, so the
+        constraint Jacobians requested by the optimizer at the same x cost nothing extra."""
+
+        x   = np.array(x, dtype = float)
+        key = input_key(self, x)
+        if self.last_gradients is not None and self.last_gradients.key == key:
+            return self.last_gradients
+
+        base = self.evaluate_outputs(x)
+        if self.gradient_method == 'adjoint':
+            derivatives = self.adjoint_derivatives(x, base)
+        else:
+            step        = self.finite_difference_step
+            points      = [x + step * np.eye(len(x))[i] for i in range(len(x))]
+            perturbed   = self.evaluate_batch(points)
+            derivatives = np.array([(output_vector(p) - output_vector(base)) / step for p in perturbed]).T
+
+        objectives  = len(base.objective)
+        inequality  = len(base.inequality_constraint)
+
+        gradients                       = Data()
+        gradients.key                   = key
+        gradients.objective             = derivatives[:objectives].reshape(len(x))
+        gradients.inequality_constraint = derivatives[objectives:objectives + inequality].reshape(-1, len(x))
+        gradients.equality_constraint   = derivatives[objectives + inequality:].reshape(-1, len(x))
+        self.last_gradients             = gradients
+
+        # leave the summary at x rather than at the last perturbed point
+        self.summary = deepcopy(base.summary)
+
+        return gradients
+
+    def adjoint_derivatives(self, x, base):
+        """Derivatives of the outputs with respect to the scaled inputs, one column per input,
+        from the adjoint of the mission solves at x; see Mission_Adjoint.mission_adjoint.
+
+        The adjoint reuses the Jacobians of the last Newton step of every segment. Each input
+        then costs one run of the procedure with the segments held at their converged
+        unknowns, rather than a mission solve. The derivatives of the outputs with respect to
+        the state each segment hands over are taken by running the adjoint_steps alone. The
+        procedure is finally run held at x, which leaves the results of x on the nexus."""
+
+        iterations = self.total_number_of_iterations
+        if self.results_key != input_key(self, x):
+            self.compute_outputs(x)
+
+        missions = list(self.missions)
+        steps    = dict((name, process[tag]) for name, process, tag in procedure_steps(self.procedure))
+        values   = output_vector(base)
+
+        def explicit_derivatives(segment):
+            columns = []
+
+            def difference(delta):
+                for name in self.adjoint_steps:
+                    if hasattr(steps[name], 'evaluate'):
+                        steps[name].evaluate(self)
+                    else:
+                        steps[name](self)
+                columns.append((output_vector(self.gather_outputs()) - values) / delta)
+
+            perturb_handed_over(segment.state.conditions, difference)
+
+            return np.array(columns).T
+
+        # the nexus leaves x until the last held run
+        self.results_key = None
+        adjoints         = [mission_adjoint(mission, explicit_derivatives) for mission in missions]
+
+        step        = self.finite_difference_step
+        derivatives = np.zeros((len(values), len(x)))
+        with held_unknowns(missions):
+            for i in range(len(x)):
+                outputs    = self.compute_outputs(x + step * np.eye(len(x))[i])
+                correction = np.sum([adjoint_correction(mission, adjoint) for mission, adjoint in zip(missions, adjoints)], axis = 0)
+                derivatives[:, i] = (output_vector(outputs) - values + correction) / step
+            self.compute_outputs(x)
+
+        self.total_number_of_iterations = iterations
+
+        return derivatives
+
+    def evaluate_batch(self, points):
+        """Outputs at each of the points. Only the points that are neither cached nor in the
+        history are solved, in parallel, and they are stored like any other evaluation."""
+
+        found   = [self.find_outputs(input_key(self, point)) for point in points]
+        outputs = [stored for stored, source in found]
+        missing = [i for i in range(len(points)) if outputs[i] is None]
+        for stored, source in found:
+            if stored is not None:
+                self.count_reuse(source)
+        self.cache_misses += len(missing)
+        for i, new_outputs in zip(missing, self.evaluate_points([points[i] for i in missing])):
+            self.store_outputs(input_key(self, points[i]), new_outputs, points[i])
+            outputs[i] = new_outputs
+
+        return outputs
+
+    def evaluate_points(self, points):
+        """Outputs at each of the points, computed by the worker processes."""
+
+        if len(points) < 2:
+            return [self.compute_outputs(point) for point in points]
+
+        state   = self.worker_state()
+        results = self.worker_pool().map(evaluate_point, [(point, state) for point in points[1:]])
+
+        # this process is left at the point the batch perturbs, so the first point is solved
+        # here while the workers run, with the steps it does not change skipped
+        first = self.compute_outputs(points[0])
+
+        return [first] + list(results)
+
+    # ------------------------------------------------------------------
+    #   Worker Processes
+    # ------------------------------------------------------------------
+    def worker_pool(self):
+        """Executor of the worker processes, started on first use."""
+
+        if self.executor is None:
+            method        = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+            self.executor = ProcessPoolExecutor(max_workers = self.max_workers,
+                                                mp_context  = multiprocessing.get_context(method),
+                                                initializer = initialize_worker,
+                                                initargs    = (self.worker_copy(),))
+
+        return self.executor
+
+    def shutdown_workers(self):
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        return
+
+    def worker_copy(self):
+        """Shallow copy of this nexus for the workers, which is pickled when they are spawned.
+        The pool, the history database and the cache stay with this process, and the aliases
+        are compiled again by each worker."""
+
+        nexus = Fast_Nexus()
+        for tag, value in self.items():
+            nexus[tag] = value
+
+        nexus.executor           = None
+        nexus.history_file       = None
+        nexus.history_connection = None
+        nexus.evaluation_cache   = OrderedDict()
+        nexus.compiled_aliases   = None
+
+        return nexus
+
+    def worker_state(self):
+        """Warm start unknowns of every mission segment that has them, by mission and segment."""
+
+        state = {}
+        if self.missions is None:
+            return state
+        for mission_tag, mission in self.missions.items():
+            for segment_tag, segment in mission.segments.items():
+                if 'warm_start_unknowns' in segment:
+                    state[(mission_tag, segment_tag)] = segment.warm_start_unknowns
+
+        return state
+
+def initialize_worker(nexus):
+
+    _worker.nexus = nexus
+
+    return
+
+def evaluate_point(task):
+
+    # workers only compute, the parent owns the cache and the history database
+    x, state = task
+    nexus    = _worker.nexus
+    for (mission_tag, segment_tag), unknowns in state.items():
+        nexus.missions[mission_tag].segments[segment_tag].warm_start_unknowns = unknowns
+
+    return nexus.compute_outputs(x)
+
+def output_vector(outputs):
+
+    return np.concatenate([outputs.objective, outputs.inequality_constraint, outputs.equality_constraint])
+
+def input_key(nexus, x):
+    """Rounded scaled inputs. Calls without x run at the initial values of the inputs."""
+
+    if x is None:
+        inputs = nexus.optimization_problem.inputs
+        x      = np.array(inputs[:,1] / inputs[:,4], dtype = float)
+
+    return tuple(np.round(np.array(x, dtype = float).ravel(), nexus.cache_decimals))
+
+# ----------------------------------------------------------------------
+#   Alias Paths and Declared Steps
+# ----------------------------------------------------------------------
+class Alias_Accessor(object):
+    """Getter and setter of one concrete alias path. The path is parsed once into attrgetters,
+    which walk it on each call, so objects a step replaces, such as the summary, are followed."""
+
+    def __init__(self, path):
+
+        parent, _, key  = path.rpartition('.')
+        self.path       = path
+        self.key        = key
+        self.get_value  = attrgetter(path)
+        self.get_parent = attrgetter(parent) if parent else (lambda nexus: nexus)
+
+    def get(self, nexus):
+
+        return self.get_value(nexus)
+
+    def set(self, nexus, value):
+
+        setattr(self.get_parent(nexus), self.key, value)
+
+class Declared_Step(object):
+    """Procedure step that only runs when one of the inputs it is declared to depend on has
+    changed since it last ran. Plain class rather than a closure, so it pickles with the nexus
+    for spawned workers."""
+
+    def __init__(self, step, inputs):
+
+        self.step        = step
+        self.inputs      = inputs
+        self.values      = None
+        self.__wrapped__ = step
+
+    def evaluate(self, nexus):
+
+        values = np.array(nexus.optimization_problem.inputs[self.inputs,1], dtype = float)
+        if self.values is not None and np.array_equal(values, self.values):
+            nexus.skipped_steps += 1
+            return nexus
+
+        # forgotten until the step completes, so a failed run is not taken for a finished one
+        self.values = None
+        result      = self.step.evaluate(nexus) if hasattr(self.step, 'evaluate') else self.step(nexus)
+        self.values = values
+
+        return result
+
+    def __call__(self, nexus):
+
+        return self.evaluate(nexus)
+
+def procedure_steps(process, prefix = ''):
+    """(name, owning process, tag) of every leaf step, in the order the procedure runs them."""
+
+    steps = []
+    for tag, step in process.items():
+        if isinstance(step, Process):
+            steps.extend(procedure_steps(step, prefix + tag + '.'))
+        else:
+            steps.append((prefix + tag, process, tag))
+
+    return steps
+
+def expand_alias_path(nexus, path):
+
+    paths = ['']
+    for part in path.split('.'):
+        if part == '*':
+            paths = [p + '.' + str(key) for p in paths for key in resolve_path(nexus, p).keys()]
+        else:
+            paths = [p + '.' + part if p else part for p in paths]
+
+    return paths
+
+def resolve_path(nexus, path):
+
+    value = nexus
+    for part in path.split('.'):
+        value = getattr(value, part)
+
+    return value
+
+# ----------------------------------------------------------------------
+#   Optimization History
+# ----------------------------------------------------------------------
+
+history_columns = ['objective', 'all_constraints', 'inequality_constraint', 'equality_constraint', 'summary', 'evaluation_time']
+
+def history_outputs(row):
+
+    outputs = Data()
+    for tag, value in zip(history_columns, row):
+        if tag == 'summary':
+            outputs[tag] = pickle.loads(value)
+        elif tag == 'evaluation_time':
+            outputs[tag] = value
+        else:
+            outputs[tag] = np.array(json.loads(value), dtype = float)
+
+    return outputs
+
+def load_history(history_file):
+    """Every evaluation stored in a history file, in the order it was run, for post processing."""
+
+    connection = sqlite3.connect(history_file)
+    try:
+        rows = connection.execute('SELECT inputs, timestamp, ' + ', '.join(history_columns) + ' FROM evaluations ORDER BY id').fetchall()
+    finally:
+        connection.close()
+
+    history = []
+    for row in rows:
+        outputs           = history_outputs(row[2:])
+        outputs.inputs    = np.array(json.loads(row[0]), dtype = float)
+        outputs.timestamp = row[1]
+        history.append(outputs)
+
+    return history
+
+# ----------------------------------------------------------------------
+#   SLSQP with Parallel or Adjoint Gradients
+# ----------------------------------------------------------------------
+def SLSQP_Solve(problem, iter = 200, tolerance = 1e-6):
+    """Same problem set up as scipy_setup.SciPy_Solve with solver = 'SLSQP': inputs are scaled
+    by their scaling column and bounded by their scaled bounds."""
+
+    inputs = problem.optimization_problem.inputs
+    x      = np.array(inputs[:,1] / inputs[:,4], dtype = float)
+    bounds = [(inputs[i,2] / inputs[i,4], inputs[i,3] / inputs[i,4]) for i in range(len(inputs))]
+
+    with problem.optimizer_evaluations():
+        outputs = sp.optimize.fmin_slsqp(problem.objective, x,
+                                         f_eqcons       = problem.equality_constraint,
+                                         f_ieqcons      = problem.inequality_constraint,
+                                         fprime         = problem.objective_gradient,
+                                         fprime_eqcons  = problem.equality_constraint_gradient,
+                                         fprime_ieqcons = problem.inequality_constraint_gradient,
+                                         bounds         = bounds,
+                                         iter           = iter,
+                                         acc            = tolerance)
+
+    return outputs
@@ -0,0 +1,268 @@
+# Mission_Adjoint.py
+#
+# Adjoint of the segment solves of a mission, for gradients of the optimization outputs that do
+# not solve the mission again for each design variable. The segments are converged with
+# converge_newton, a damped Newton solve that keeps the residual Jacobian of its last step and
+# how the state handed to the next segment changes with the unknowns. Sweeping the segments
+# backwards with these Jacobians gives the adjoint of every segment, after which each design
+# variable only costs one pass of the procedure with every segment held at its converged
+# unknowns. Fast_Nexus does this when its gradient_method is 'adjoint':
+#
+#     enable_adjoint(mission)
+#     nexus.gradient_method = 'adjoint'
+#     nexus.adjoint_steps   = ['post_process']
+#
+# where adjoint_steps are the procedure steps that compute the outputs from the mission results.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from RCAIDE.Framework.Core import Data
+
+import numpy as np
+from contextlib import contextmanager
+
+# ----------------------------------------------------------------------
+#   Newton Solve
+# ----------------------------------------------------------------------
+def enable_adjoint(mission):
+    """Converges every segment of mission with converge_newton."""
+
+    for segment in mission.segments:
+        segment.adjoint          = Data()
+        segment.adjoint.hold     = False
+        segment.process.converge = converge_newton
+
+    return mission
+
+def converge_newton(segment):
+    """Damped Newton solve of the segment residuals with dense finite difference Jacobians. The
+    Jacobian of the last step, of the residuals and of the handed over state, is kept on
+    segment.adjoint with the converged unknowns and residuals. While the segment is held, the
+    converged unknowns are evaluated once instead."""
+
+    adjoint = segment.adjoint
+    if adjoint.hold:
+        adjoint.held_residuals = evaluate_segment(segment, adjoint.unknowns)[0]
+        return
+
+    numerics       = segment.state.numerics
+    tolerance      = numerics.tolerance_solution
+    max_iterations = getattr(numerics, 'max_newton_iterations', 50)
+
+    unknowns         = segment.state.unknowns.pack_array()
+    residuals, state = evaluate_segment(segment, unknowns)
+    jacobians        = None
+    converged        = np.linalg.norm(residuals) == 0.
+    iterations       = 0
+
+    while not converged and iterations < max_iterations:
+        iterations += 1
+        jacobians   = unknowns_jacobians(segment, unknowns, residuals, state)
+        step, new_unknowns, new_residuals, new_state = line_search(segment, jacobians[0], unknowns, residuals)
+        if step is None:
+            break
+
+        converged = np.linalg.norm(step) <= tolerance * (np.linalg.norm(new_unknowns) + tolerance) \
+                    or np.linalg.norm(new_residuals) == 0.
+        unknowns  = new_unknowns
+        residuals = new_residuals
+        state     = new_state
+
+    if jacobians is None:
+        jacobians = unknowns_jacobians(segment, unknowns, residuals, state)
+
+    # leave the segment conditions consistent with the returned unknowns
+    evaluate_segment(segment, unknowns)
+
+    adjoint.unknowns  = unknowns
+    adjoint.residuals = residuals
+    adjoint.dR_dU     = jacobians[0]
+    adjoint.dS_dU     = jacobians[1]
+
+    numerics.converged = bool(converged)
+    segment.converged  = bool(converged)
+    if not converged:
+        print("Segment did not converge. Segment Tag: " + segment.tag)
+
+    return
+
+def evaluate_segment(segment, unknowns, initialize = False):
+    """Residuals and handed over state of the segment at unknowns."""
+
+    if initialize:
+        segment.process.initialize(segment)
+    segment.state.unknowns.unpack_array(unknowns)
+    segment.process.iterate(segment)
+
+    return segment.state.residuals.pack_array(), handed_over_state(segment.state.conditions)
+
+def line_search(segment, jacobian, unknowns, residuals, minimum_step = 1. / 64):
+    """Backtracks along the Newton direction until the residual norm decreases. Returns Nones
+    if no acceptable step is found."""
+
+    direction = -np.linalg.lstsq(jacobian, residuals, rcond = None)[0]
+    norm      = np.linalg.norm(residuals)
+    alpha     = 1.
+
+    while alpha >= minimum_step:
+        new_unknowns             = unknowns + alpha * direction
+        new_residuals, new_state = evaluate_segment(segment, new_unknowns)
+        if np.linalg.norm(new_residuals) < (1. - 1E-4 * alpha) * norm:
+            return alpha * direction, new_unknowns, new_residuals, new_state
+        alpha = alpha / 2.
+
+    return None, None, None, None
+
+def finite_difference_step(values):
+
+    return np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(values), 1.)
+
+def unknowns_jacobians(segment, unknowns, residuals, state):
+    """Forward differences of the residuals and of the handed over state, one iterate
+    evaluation per packed unknown."""
+
+    step  = finite_difference_step(unknowns)
+    dR_dU = np.zeros((len(residuals), len(unknowns)))
+    dS_dU = np.zeros((len(state), len(unknowns)))
+    for j in range(len(unknowns)):
+        perturbed                = unknowns.copy()
+        perturbed[j]            += step[j]
+        new_residuals, new_state = evaluate_segment(segment, perturbed)
+        dR_dU[:, j]              = (new_residuals - residuals) / step[j]
+        dS_dU[:, j]              = (new_state - state) / step[j]
+
+    return dR_dU, dS_dU
+
+# ----------------------------------------------------------------------
+#   Adjoint
+# ----------------------------------------------------------------------
+def mission_adjoint(mission, explicit_derivatives):
+    """Adjoint of every segment of a converged mission, for several outputs at once.
+
+    Each segment k solves R_k(U_k, s_k-1, p) = 0 for its unknowns U_k, given the state s_k-1
+    handed over by the segment before it, and hands over s_k = S_k(U_k, s_k-1, p). Sweeping
+    the segments backwards, with E_k the derivatives of the outputs with respect to s_k when
+    the unknowns are held,
+        dR_k/dU_k^T L_k = -dS_k/dU_k^T M_k
+        M_k-1           =  dR_k/ds_k-1^T L_k + dS_k/ds_k-1^T M_k + E_k-1^T
+    starting from M_K = E_K^T. The derivative of the outputs with respect to a design variable
+    p is then the change of the outputs in a pass with every segment held at its unknowns, plus
+    sum_k L_k^T dR_k/dp of the residuals of that pass; see adjoint_correction.
+
+    Assumptions:
+        The outputs read the mission only through the state each segment hands over: the last
+        row of the total mass, the inertial position and time, and of every energy array of
+        the energy conditions.
+
+    Inputs:
+        mission               converged mission, every segment solved with converge_newton
+        explicit_derivatives  function of a segment returning E_k, the derivatives of the
+                              outputs with respect to its handed over state
+
+    Returns:
+        adjoints              list with L_k of every segment, one column per output
+    """
+
+    segments = list(mission.segments.values())
+    for segment in segments:
+        if 'adjoint' not in segment or 'dR_dU' not in segment.adjoint:
+            raise ValueError('segment ' + segment.tag + ' was not solved with converge_newton')
+
+    adjoints = [None] * len(segments)
+    mu       = explicit_derivatives(segments[-1]).T
+    for k in reversed(range(len(segments))):
+        adjoint     = segments[k].adjoint
+        adjoints[k] = np.linalg.lstsq(adjoint.dR_dU.T, -np.dot(adjoint.dS_dU.T, mu), rcond = None)[0]
+        if k > 0:
+            dR_ds, dS_ds = initial_state_derivatives(segments[k])
+            mu           = np.dot(dR_ds.T, adjoints[k]) + np.dot(dS_ds.T, mu) + explicit_derivatives(segments[k - 1]).T
+
+    return adjoints
+
+def adjoint_correction(mission, adjoints):
+    """sum_k L_k^T (R_k - R_k converged) of the residuals of the last held pass."""
+
+    segments = list(mission.segments.values())
+    terms    = [np.dot(L.T, segment.adjoint.held_residuals - segment.adjoint.residuals)
+                for segment, L in zip(segments, adjoints)]
+
+    return np.sum(terms, axis = 0)
+
+@contextmanager
+def held_unknowns(missions):
+    """Evaluates the segments of missions once at their converged unknowns, without solving."""
+
+    segments = [segment for mission in missions for segment in mission.segments]
+    for segment in segments:
+        segment.adjoint.hold = True
+    try:
+        yield
+    finally:
+        for segment in segments:
+            segment.adjoint.hold = False
+
+    return
+
+def initial_state_derivatives(segment):
+    """Derivatives of the residuals and of the handed over state of a segment with respect to
+    the state it starts from, perturbed through segment.state.initials."""
+
+    unknowns         = segment.adjoint.unknowns
+    residuals, state = evaluate_segment(segment, unknowns, initialize = True)
+    dR_ds            = []
+    dS_ds            = []
+
+    def difference(delta):
+        new_residuals, new_state = evaluate_segment(segment, unknowns, initialize = True)
+        dR_ds.append((new_residuals - residuals) / delta)
+        dS_ds.append((new_state - state) / delta)
+
+    perturb_handed_over(segment.state.initials.conditions, difference)
+
+    # leave the segment conditions at the converged solution
+    evaluate_segment(segment, unknowns, initialize = True)
+
+    return np.array(dR_ds).T, np.array(dS_ds).T
+
+def perturb_handed_over(conditions, evaluate):
+    """Calls evaluate(delta) with each entry of the handed over state of conditions in turn
+    increased by delta, and puts the entry back afterwards."""
+
+    for array in handed_over_arrays(conditions):
+        row = array[-1].reshape(-1)
+        for j in range(row.size):
+            value  = row[j]
+            delta  = finite_difference_step(value)
+            row[j] = value + delta
+            try:
+                evaluate(delta)
+            finally:
+                row[j] = value
+
+    return
+
+def handed_over_state(conditions):
+
+    return np.concatenate([array[-1].ravel() for array in handed_over_arrays(conditions)])
+
+def handed_over_arrays(conditions):
+    """Arrays whose last row the next segment starts from."""
+
+    arrays  = [conditions.weights.total_mass, conditions.frames.inertial.position_vector,
+               conditions.frames.inertial.time]
+    arrays += find_arrays(conditions.energy, 'energy')
+
+    return arrays
+
+def find_arrays(data, key):
+
+    arrays = []
+    for tag, value in data.items():
+        if isinstance(value, Data):
+            arrays += find_arrays(value, key)
+        elif tag == key and isinstance(value, np.ndarray):
+            arrays.append(value)
+
+    return arrays
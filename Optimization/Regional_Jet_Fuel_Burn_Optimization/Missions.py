@@ -1,6 +1,6 @@
 
 import RCAIDE
-from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Core import Units, Data
 
 import numpy as np
 
@@ -8,7 +8,7 @@ import numpy as np
 #   Define the Mission
 # ----------------------------------------------------------------------
     
-def setup(analyses): 
+def setup(analyses, warm_start = False): 
     # ------------------------------------------------------------------
     #   Base Mission
     # ------------------------------------------------------------------
@@ -17,6 +17,9 @@ def setup(analyses):
     mission.tag  = 'base'
     missions.append(mission)
 
+    if warm_start:
+        enable_warm_start(mission)
+
     return missions
  
      
@@ -257,4 +260,49 @@ def mission_setup(analyses):
     mission.append_segment(segment)
      
 
-    return mission
\ No newline at end of file
+    return mission
+
+
+# ----------------------------------------------------------------------
+#   Warm Start
+# ----------------------------------------------------------------------
+
+def enable_warm_start(mission):
+    """Opts a mission into warm starting. After each evaluate, update_warm_start stores the
+    converged unknowns of every segment; on the next evaluate they replace the default initial
+    guess as the last step of the segment initialization."""
+
+    mission.warm_start = True
+    for segment in mission.segments:
+        segment.warm_start_unknowns = None
+        segment.process.initialize.warm_start = apply_warm_start
+
+    return mission
+
+def update_warm_start(mission, results):
+    """Caches the converged unknowns of each segment, keyed by segment tag."""
+
+    if not getattr(mission, 'warm_start', False):
+        return mission
+
+    for tag, segment in mission.segments.items():
+        unknowns = results.segments[tag].state.unknowns
+        segment.warm_start_unknowns = Data()
+        for key, value in unknowns.items():
+            segment.warm_start_unknowns[key] = np.array(value, copy = True)
+
+    return mission
+
+def apply_warm_start(segment):
+
+    cached = segment.warm_start_unknowns
+    if cached is None:
+        return
+
+    # unknowns whose size changed, e.g. with a new number of control points, keep the default guess
+    unknowns = segment.state.unknowns
+    for key, value in cached.items():
+        if key in unknowns and np.shape(unknowns[key]) == np.shape(value):
+            unknowns[key] = np.array(value, copy = True)
+
+    return
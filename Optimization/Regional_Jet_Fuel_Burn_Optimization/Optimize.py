@@ -10,32 +10,39 @@
 import RCAIDE 
 from RCAIDE.Framework.Core import Units, Data
 import numpy as np
+import sys
 import Vehicles
 import Analyses
 import Missions
 import Procedure
 import Plot_Mission
+import Mission_Adjoint
 import matplotlib.pyplot as plt
-from RCAIDE.Framework.Optimization.Common import  Nexus
-from RCAIDE.Framework.Optimization .Packages.scipy import scipy_setup 
+from Fast_Nexus import Fast_Nexus, SLSQP_Solve
+from Surrogate_Optimization import Surrogate_Solve
 
 # ----------------------------------------------------------------------        
 #   Run the whole thing
 # ----------------------------------------------------------------------  
-def main():
+def main(surrogate = False):
     
     problem = setup()
     
     ## Base Input Values
     output = problem.objective()
      
-     
-    # Uncomment for the first optimization
-    output = scipy_setup.SciPy_Solve(problem,solver='SLSQP')
+    if surrogate:
+        # Gaussian process models of the outputs, which need fewer mission evaluations than SLSQP
+        output = Surrogate_Solve(problem, max_evaluations = 30, batch_size = 4)
+    else:
+        output = SLSQP_Solve(problem)
     print (output)    
 
+    # solves the optimum again if the last mission results on the nexus are from another point
+    fuel_margin = problem.all_constraints(output)
+
     print('fuel burn = ', problem.summary.base_mission_fuelburn)
-    print('fuel margin = ', problem.all_constraints())
+    print('fuel margin = ', fuel_margin)
     
     Plot_Mission.plot_mission(problem)
     
@@ -47,7 +54,12 @@ def main():
 
 def setup():
 
-    nexus = Nexus()
+    nexus = Fast_Nexus()
+    
+    # uncomment to store every evaluated point, so a restarted run replays them instead of solving
+    # again; points are only replayed while the problem and the files below are unchanged
+    # nexus.history_file = 'optimization_history.db'
+    nexus.history_sources = [Vehicles.__file__, Analyses.__file__, Missions.__file__, Procedure.__file__, Mission_Adjoint.__file__]
     problem = Data()
     nexus.optimization_problem = problem
 
@@ -106,12 +118,26 @@ def setup():
     # -------------------------------------------------------------------
     #  Missions
     # -------------------------------------------------------------------
-    nexus.missions = Missions.setup(nexus.analyses)
+    nexus.missions = Missions.setup(nexus.analyses, warm_start = True)
+
+    # gradients from the adjoint of the segment solves, which keep their last Newton Jacobians,
+    # instead of a mission solve per input; post_process computes the outputs from the results
+    Mission_Adjoint.enable_adjoint(nexus.missions.base)
+    nexus.gradient_method = 'adjoint'
+    nexus.adjoint_steps   = ['post_process']
     
     # -------------------------------------------------------------------
     #  Procedure
     # -------------------------------------------------------------------    
     nexus.procedure = Procedure.setup()
+
+    # inputs each sizing step depends on; a step is skipped at points where they are unchanged,
+    # so a wing area perturbation does not redesign the engines. Steps not listed always run
+    nexus.step_inputs = {
+        'update_aircraft.wings'    : ['wing_area'],
+        'update_aircraft.fuselage' : ['cruise_altitude'],
+        'update_aircraft.engines'  : ['cruise_altitude'],
+    }
     
     # -------------------------------------------------------------------
     #  Summary
@@ -121,5 +147,6 @@ def setup():
     return nexus
      
 if __name__ == '__main__':
-    main()
+    # python Optimize.py surrogate  optimizes with Surrogate_Solve instead of SLSQP_Solve
+    main(surrogate = 'surrogate' in sys.argv[1:])
     plt.show()
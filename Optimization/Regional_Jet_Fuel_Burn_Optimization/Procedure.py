@@ -5,6 +5,8 @@ from RCAIDE.Framework.Core import Units, Data
 from RCAIDE.Framework.Analyses.Process import Process   
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor   import design_turbofan
 
+import Missions
+
 # ----------------------------------------------------------------------        
 #   Setup
 # ----------------------------------------------------------------------   
@@ -17,7 +19,10 @@ def setup():
     
     # size the base config
     procedure = Process()
-    procedure.update_aircraft = update_aircraft
+    procedure.update_aircraft          = Process()
+    procedure.update_aircraft.wings    = update_wings
+    procedure.update_aircraft.fuselage = update_fuselage
+    procedure.update_aircraft.engines  = update_engines
     
     # find the weights
     procedure.weights = weight 
@@ -36,28 +41,44 @@ def setup():
 # ----------------------------------------------------------------------    
 
 def find_target_range(nexus,mission):
-    
+
+    segments     = mission.segments
+    cruise_range = compute_cruise_range(mission,mission.design_range,segments['climb_3'].altitude_end)
+
+    segments['cruise'].distance = cruise_range
+
+    return nexus
+
+def compute_cruise_range(mission,design_range,cruise_altitude):
+    """Cruise distance left over once the climb and descent legs are flown. design_range and
+    cruise_altitude may be scalars or arrays of mission variants; they are broadcast against
+    each other so a whole sweep is computed in a single call."""
+
     segments = mission.segments
     climb_1  = segments['climb_1']
     climb_2  = segments['climb_2']
     climb_3  = segments['climb_3']
-  
+
     descent_1 = segments['descent_1']
     descent_2 = segments['descent_2']
     descent_3 = segments['descent_3']
 
+    design_range    = np.asarray(design_range,dtype=float)
+    cruise_altitude = np.asarray(cruise_altitude,dtype=float)
+
     x_climb_1   = climb_1.altitude_end/np.tan(np.arcsin(climb_1.climb_rate/climb_1.air_speed))
     x_climb_2   = (climb_2.altitude_end-climb_1.altitude_end)/np.tan(np.arcsin(climb_2.climb_rate/climb_2.air_speed))
-    x_climb_3   = (climb_3.altitude_end-climb_2.altitude_end)/np.tan(np.arcsin(climb_3.climb_rate/climb_3.air_speed)) 
-    x_descent_1 = (climb_3.altitude_end-descent_1.altitude_end)/np.tan(np.arcsin(descent_1.descent_rate/descent_1.air_speed))
+    x_climb_3   = (cruise_altitude-climb_2.altitude_end)/np.tan(np.arcsin(climb_3.climb_rate/climb_3.air_speed))
+    x_descent_1 = (cruise_altitude-descent_1.altitude_end)/np.tan(np.arcsin(descent_1.descent_rate/descent_1.air_speed))
     x_descent_2 = (descent_1.altitude_end-descent_2.altitude_end)/np.tan(np.arcsin(descent_2.descent_rate/descent_2.air_speed))
     x_descent_3 = (descent_2.altitude_end-descent_3.altitude_end)/np.tan(np.arcsin(descent_3.descent_rate/descent_3.air_speed))
-    
-    cruise_range = mission.design_range-(x_climb_1+x_climb_2+x_climb_3+x_descent_1+x_descent_2+x_descent_3)
-  
-    segments['cruise'].distance = cruise_range
-    
-    return nexus
+
+    cruise_range = design_range-(x_climb_1+x_climb_2+x_climb_3+x_descent_1+x_descent_2+x_descent_3)
+
+    if cruise_range.ndim == 0:
+        cruise_range = float(cruise_range)
+
+    return cruise_range
 
 # ----------------------------------------------------------------------        
 #   Design Mission
@@ -69,38 +90,56 @@ def design_mission(nexus):
     find_target_range(nexus,mission)
     results = nexus.results
     results.base = mission.evaluate()
+
+    # reuse the converged unknowns as the initial guess of the next optimizer iteration
+    Missions.update_warm_start(mission, results.base)
     
     return nexus
 
 # ----------------------------------------------------------------------        
 #   Sizing
 # ----------------------------------------------------------------------    
-def update_aircraft(nexus):
+def update_wings(nexus):
     configs = nexus.vehicle_configurations
-    base    = configs.base
+
+    for config in configs:
+        config.wings.horizontal_stabilizer.areas.reference = (26.0/92.0)*config.wings.main_wing.areas.reference
+            
+        for wing in config.wings:
+            wing = RCAIDE.Library.Methods.Geometry.Planform.wing_planform(wing)
+            wing.areas.exposed  = 0.8 * wing.areas.wetted
+            wing.areas.affected = 0.6 * wing.areas.reference
+
+    return nexus
+
+def update_fuselage(nexus):
+    base = nexus.vehicle_configurations.base
     
     # find conditions
-    air_speed   = nexus.missions.base.segments['cruise'].air_speed 
     altitude    = nexus.missions.base.segments['climb_3'].altitude_end
-    atmosphere  = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976() 
+    atmosphere  = nexus.analyses.base.atmosphere
     freestream  = atmosphere.compute_values(altitude)
     freestream0 = atmosphere.compute_values(6000.*Units.ft)  #cabin altitude
     
     diff_pressure         = np.max(freestream0.pressure-freestream.pressure,0)
     fuselage              = base.fuselages['tube_fuselage']
     fuselage.differential_pressure = diff_pressure 
+
+    return nexus
+
+def update_engines(nexus):
+    configs = nexus.vehicle_configurations
+    
+    # find conditions
+    air_speed   = nexus.missions.base.segments['cruise'].air_speed 
+    altitude    = nexus.missions.base.segments['climb_3'].altitude_end
+    atmosphere  = nexus.analyses.base.atmosphere
+    freestream  = atmosphere.compute_values(altitude)
     
     # now size engine
     mach_number        = air_speed/freestream.speed_of_sound 
     
     for config in configs:
-        config.wings.horizontal_stabilizer.areas.reference = (26.0/92.0)*config.wings.main_wing.areas.reference
-            
-        for wing in config.wings:
-            wing = RCAIDE.Library.Methods.Geometry.Planform.wing_planform(wing)
-            wing.areas.exposed  = 0.8 * wing.areas.wetted
-            wing.areas.affected = 0.6 * wing.areas.reference
-            
         # redesign turbofan 
         for network in  config.networks: 
             for propulsor in  network.propulsors: 
@@ -0,0 +1,259 @@
+# Profiler.py
+#
+# Hierarchical wall time profiler for the analysis procedure. Every step of the procedure and
+# of the mission and segment processes is timed with the stack of process steps it was called
+# from, so a segment solve shows up as
+#
+#     missions;design_mission;base;...;climb_1;converge;iterate;conditions;aerodynamics
+#
+# The collected stacks can be written in the folded format read by flamegraph.pl and
+# speedscope, or reduced to a per-segment table of solve time, residual evaluations and the
+# time spent in each analysis.
+#
+# Usage:
+#   python Profiler.py        profile one evaluation of the optimization problem
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Framework.Analyses.Process import Process
+
+import time
+from contextlib import contextmanager
+
+import Optimize
+
+# analyses reported in the segment summary, matched against the names of the process steps
+analysis_names = ['atmosphere', 'aerodynamics', 'stability', 'energy', 'weights']
+
+# ----------------------------------------------------------------------
+#   Profile one evaluation
+# ----------------------------------------------------------------------
+def main():
+
+    problem  = Optimize.setup()
+
+    # profile a full run of the procedure, not a lookup of stored outputs
+    problem.history_file = None
+    problem.cache_size   = 0
+    problem.step_inputs  = {}
+
+    profiler = Profiler()
+    profiler.instrument_nexus(problem)
+    try:
+        problem.objective()
+    finally:
+        profiler.release()
+
+    profiler.print_segment_summary()
+    profiler.write_folded('procedure_profile.folded')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Profiler
+# ----------------------------------------------------------------------
+class Profiler(object):
+    """Collects the inclusive wall time and the number of calls of every stack of process steps.
+    Instrumenting puts profiled copies of the processes in place of the originals, which are
+    left untouched and put back by release."""
+
+    def __init__(self):
+
+        self.stack        = []
+        self.records      = {}
+        self.segment_tags = []
+        self.installed    = []
+
+    @contextmanager
+    def frame(self, name):
+
+        self.stack.append(name)
+        path  = tuple(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record     = self.records.setdefault(path, [0., 0])
+            record[0] += time.perf_counter() - start
+            record[1] += 1
+            self.stack.pop()
+
+        return
+
+    # ------------------------------------------------------------------
+    #   Instrumentation
+    # ------------------------------------------------------------------
+    def instrument_nexus(self, nexus):
+        """Profiles the procedure steps and every mission the procedure evaluates."""
+
+        self.install(nexus, 'procedure')
+        for mission in nexus.missions:
+            self.instrument_mission(mission)
+
+        return
+
+    def instrument_mission(self, mission):
+        """Each segment process gets a frame named after the segment, and the nested processes
+        of the segment, including the solver iterations, are profiled below it."""
+
+        self.install(mission, 'process', mission.tag)
+        for segment in mission.segments:
+            self.install(segment, 'process', segment.tag)
+            if segment.tag not in self.segment_tags:
+                self.segment_tags.append(segment.tag)
+
+        return
+
+    def install(self, owner, tag, name = None):
+        """Replaces the process owner[tag] with a profiled copy, remembering the original."""
+
+        self.installed.append((owner, tag, owner[tag]))
+        owner[tag] = self.instrument(owner[tag], name)
+
+        return
+
+    def instrument(self, process, name = None):
+        """Profiled copy of process, with every step wrapped in a timed frame and nested
+        processes copied in turn. A named copy additionally gets a frame of its own around all
+        of its steps. The original process is not modified."""
+
+        profiled = Profiled_Process()
+        for tag, step in process.items():
+            if isinstance(step, Process):
+                profiled[tag] = self.instrument(step, tag)
+            elif callable(step):
+                profiled[tag] = self.timed_step(tag, step)
+            else:
+                profiled[tag] = step
+
+        if name is not None:
+            _process_frames[id(profiled)] = (self, name)
+
+        return profiled
+
+    def release(self):
+        """Puts the original processes back, in the reverse order they were replaced, and
+        removes the frames of the copies."""
+
+        for owner, tag, process in reversed(self.installed):
+            remove_frames(owner[tag])
+            owner[tag] = process
+        self.installed = []
+
+        return
+
+    def timed_step(self, tag, step):
+
+        def timed(*args, **kwargs):
+            with self.frame(tag):
+                if hasattr(step, 'evaluate'):
+                    return step.evaluate(*args, **kwargs)
+                return step(*args, **kwargs)
+
+        timed.step = step
+
+        return timed
+
+    # ------------------------------------------------------------------
+    #   Reports
+    # ------------------------------------------------------------------
+    def self_times(self):
+        """Time spent in each stack excluding the stacks called from it."""
+
+        times = {path: record[0] for path, record in self.records.items()}
+        for path, record in self.records.items():
+            if path[:-1] in times:
+                times[path[:-1]] -= record[0]
+
+        return times
+
+    def write_folded(self, filename):
+        """One line per stack with its self time in microseconds, as expected by flamegraph.pl
+        and speedscope."""
+
+        with open(filename, 'w') as file:
+            for path, elapsed in sorted(self.self_times().items()):
+                file.write('{} {}\n'.format(';'.join(path), max(int(round(elapsed * 1E6)), 0)))
+
+        return
+
+    def segment_summary(self):
+        """Solve time, number of residual evaluations, which are the calls of the segment
+        iterate process, and total time per analysis for each segment. Repeated evaluations of
+        the same segment are accumulated."""
+
+        summary = Data()
+        for tag in self.segment_tags:
+            summary[tag] = Data(time = 0., evaluations = 0, residual_evaluations = 0,
+                                analyses = Data((name, 0.) for name in analysis_names))
+
+        for path, (elapsed, calls) in self.records.items():
+            tags = [name for name in path if name in summary]
+            if not tags:
+                continue
+            segment = summary[tags[0]]
+            steps   = path[path.index(tags[0]) + 1:]
+
+            if not steps:
+                segment.time        += elapsed
+                segment.evaluations += calls
+            elif steps[-1] == 'iterate':
+                segment.residual_evaluations += calls
+            for name in analysis_names:
+                # nested steps of an analysis are already included in its time
+                if steps and name in steps[-1] and not any(name in step for step in steps[:-1]):
+                    segment.analyses[name] += elapsed
+
+        return summary
+
+    def print_segment_summary(self):
+
+        summary = self.segment_summary()
+        header  = '{:20s} {:>10s} {:>6s} {:>20s}'.format('segment', 'time [s]', 'calls', 'residual evaluations')
+        header += ''.join(' {:>13s}'.format(name) for name in analysis_names)
+        print(header)
+        for tag, segment in summary.items():
+            line  = '{:20s} {:10.3f} {:6d} {:20d}'.format(tag, segment.time, segment.evaluations, segment.residual_evaluations)
+            line += ''.join(' {:13.3f}'.format(segment.analyses[name]) for name in analysis_names)
+            print(line)
+
+        return
+
+# ----------------------------------------------------------------------
+#   Profiled Process
+# ----------------------------------------------------------------------
+
+# Process keeps its steps as items, so the frame of a profiled copy is kept outside of it; the
+# profiler holds every copy until release, so the ids are not reused while they are in here
+_process_frames = {}
+
+def remove_frames(process):
+
+    _process_frames.pop(id(process), None)
+    for step in process.values():
+        if isinstance(step, Profiled_Process):
+            remove_frames(step)
+
+    return
+
+class Profiled_Process(Process):
+    """Process that opens a frame around its steps when it has been given a name."""
+
+    def evaluate(self, *args, **kwargs):
+
+        if id(self) not in _process_frames:
+            return super().evaluate(*args, **kwargs)
+
+        profiler, name = _process_frames[id(self)]
+        with profiler.frame(name):
+            return super().evaluate(*args, **kwargs)
+
+    def __call__(self, *args, **kwargs):
+
+        return self.evaluate(*args, **kwargs)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+# Surrogate_Optimization.py
+#
+# Surrogate-based optimization driver for a Fast_Nexus problem. The scaled input bounds are
+# sampled with a Latin hypercube, the samples are evaluated in parallel, and Gaussian process
+# models of the objective and constraints are then used to pick new points by constrained
+# expected improvement. Only the picked points are evaluated with the full procedure.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from RCAIDE.Framework.Core import Data
+
+import numpy as np
+import scipy as sp
+import scipy.linalg
+import scipy.optimize
+import scipy.stats
+
+# ----------------------------------------------------------------------
+#   Surrogate Solve
+# ----------------------------------------------------------------------
+def Surrogate_Solve(problem, initial_samples = None, max_evaluations = 40, batch_size = 1,
+                    equality_tolerance = 1E-3, improvement_tolerance = 1E-4, seed = 0):
+    """Minimizes the objective of problem subject to its constraints with at most max_evaluations
+    procedure runs. The inputs are scaled and bounded as in SLSQP_Solve.
+
+    Inputs:
+        problem                Fast_Nexus with the optimization problem set up
+        initial_samples        size of the Latin hypercube, defaults to 4 per input
+        max_evaluations        total number of procedure runs, samples included
+        batch_size             points added per iteration; they are evaluated in parallel
+        equality_tolerance     |h| below which an equality constraint counts as satisfied
+        improvement_tolerance  stop when the expected improvement falls below this
+        seed                   seed of the random sampling
+
+    Returns:
+        x                      best feasible scaled inputs found, or the least infeasible
+    """
+
+    inputs = problem.optimization_problem.inputs
+    lower  = np.array(inputs[:,2] / inputs[:,4], dtype = float)
+    upper  = np.array(inputs[:,3] / inputs[:,4], dtype = float)
+    rng    = np.random.default_rng(seed)
+
+    if initial_samples is None:
+        initial_samples = 4 * len(inputs)
+
+    # one pool of worker processes evaluates every batch
+    with problem.optimizer_evaluations():
+        X = lower + (upper - lower) * latin_hypercube(initial_samples, len(inputs), rng)
+        Y = evaluate_samples(problem, X)
+
+        while len(X) < max_evaluations:
+            models = fit_models(X, Y, lower, upper)
+            best   = best_sample(Y, equality_tolerance)
+
+            batch = []
+            for _ in range(min(batch_size, max_evaluations - len(X))):
+                x_new, improvement = maximize_acquisition(models, Y, best, lower, upper, equality_tolerance, rng)
+                if best is not None and improvement < improvement_tolerance * max(abs(Y.objective[best]), 1.):
+                    break
+                batch.append(x_new)
+
+                # kriging believer: the next point of the batch assumes x_new returns the model mean
+                for model in models.values():
+                    model.add_point(x_new)
+
+            if not batch:
+                break
+
+            X = np.vstack([X, batch])
+            Y = append_samples(Y, evaluate_samples(problem, np.array(batch)))
+
+    best = best_sample(Y, equality_tolerance)
+    if best is None:
+        best = np.argmin(constraint_violation(Y, equality_tolerance))
+
+    print('Surrogate optimization finished after ' + str(len(X)) + ' evaluations')
+
+    return X[best]
+
+# ----------------------------------------------------------------------
+#   Sampling and Evaluation
+# ----------------------------------------------------------------------
+def latin_hypercube(n, dimensions, rng):
+    """n points in the unit cube with exactly one point in each of the n slices of every axis."""
+
+    samples = np.zeros((n, dimensions))
+    for d in range(dimensions):
+        samples[:, d] = (rng.permutation(n) + rng.uniform(size = n)) / n
+
+    return samples
+
+def evaluate_samples(problem, X):
+    """Objective and constraints at every row of X, solved in parallel by the nexus."""
+
+    outputs = problem.evaluate_batch(list(X))
+
+    Y            = Data()
+    Y.objective  = np.array([float(np.atleast_1d(o.objective)[0]) for o in outputs])
+    Y.inequality = np.array([o.inequality_constraint for o in outputs]).reshape(len(X), -1)
+    Y.equality   = np.array([o.equality_constraint for o in outputs]).reshape(len(X), -1)
+
+    return Y
+
+def append_samples(Y, new):
+
+    Y.objective  = np.concatenate([Y.objective, new.objective])
+    Y.inequality = np.vstack([Y.inequality, new.inequality])
+    Y.equality   = np.vstack([Y.equality, new.equality])
+
+    return Y
+
+def constraint_violation(Y, equality_tolerance):
+
+    violation  = np.sum(np.maximum(-Y.inequality, 0.), axis = 1)
+    violation += np.sum(np.maximum(np.abs(Y.equality) - equality_tolerance, 0.), axis = 1)
+
+    return violation
+
+def best_sample(Y, equality_tolerance):
+
+    feasible = np.where(constraint_violation(Y, equality_tolerance) == 0.)[0]
+    if len(feasible) == 0:
+        return None
+
+    return feasible[np.argmin(Y.objective[feasible])]
+
+# ----------------------------------------------------------------------
+#   Acquisition
+# ----------------------------------------------------------------------
+def fit_models(X, Y, lower, upper):
+
+    models = {'objective' : Gaussian_Process(X, Y.objective, lower, upper)}
+    for i in range(Y.inequality.shape[1]):
+        models['inequality_' + str(i)] = Gaussian_Process(X, Y.inequality[:, i], lower, upper)
+    for i in range(Y.equality.shape[1]):
+        models['equality_' + str(i)] = Gaussian_Process(X, Y.equality[:, i], lower, upper)
+
+    return models
+
+def acquisition(x, models, target, equality_tolerance):
+    """Expected improvement over target times the probability that every constraint holds.
+    Without a feasible sample yet (target None) only the probability of feasibility is used."""
+
+    x     = np.atleast_2d(x)
+    value = np.ones(len(x))
+
+    for tag, model in models.items():
+        mean, std = model.predict(x)
+        if tag.startswith('inequality'):
+            value *= sp.stats.norm.cdf(mean / std)
+        elif tag.startswith('equality'):
+            value *= sp.stats.norm.cdf((equality_tolerance - mean) / std) - sp.stats.norm.cdf((-equality_tolerance - mean) / std)
+        elif target is not None:
+            z      = (target - mean) / std
+            value *= (target - mean) * sp.stats.norm.cdf(z) + std * sp.stats.norm.pdf(z)
+
+    return value
+
+def maximize_acquisition(models, Y, best, lower, upper, equality_tolerance, rng, candidates = 2000, starts = 5):
+    """Screens random candidates and polishes the best few with a bounded quasi-Newton search."""
+
+    target = None if best is None else Y.objective[best]
+    X      = lower + (upper - lower) * rng.uniform(size = (candidates, len(lower)))
+    values = acquisition(X, models, target, equality_tolerance)
+
+    best_x, best_value = X[np.argmax(values)], np.max(values)
+    for x0 in X[np.argsort(-values)[:starts]]:
+        result = sp.optimize.minimize(lambda x: -acquisition(x, models, target, equality_tolerance)[0], x0,
+                                      method = 'L-BFGS-B', bounds = list(zip(lower, upper)))
+        if -result.fun > best_value:
+            best_x, best_value = result.x, -result.fun
+
+    return best_x, best_value
+
+# ----------------------------------------------------------------------
+#   Gaussian Process
+# ----------------------------------------------------------------------
+class Gaussian_Process(object):
+    """Gaussian process regression with a squared exponential kernel on inputs normalized to the
+    unit cube. The length scale is picked from a grid by the marginal likelihood."""
+
+    def __init__(self, X, y, lower, upper, length_scales = np.logspace(-1.5, 0.5, 15), nugget = 1E-8):
+
+        self.lower  = lower
+        self.range  = np.where(upper > lower, upper - lower, 1.)
+        self.nugget = nugget
+        self.y_mean = np.mean(y)
+        self.y_std  = np.std(y) if np.std(y) > 0. else 1.
+        self.X      = self.normalize(X)
+        self.y      = (np.asarray(y, dtype = float) - self.y_mean) / self.y_std
+
+        likelihoods       = [self.log_likelihood(length_scale) for length_scale in length_scales]
+        self.length_scale = length_scales[int(np.argmax(likelihoods))]
+        self.factorize()
+
+    def normalize(self, X):
+
+        return (np.atleast_2d(X) - self.lower) / self.range
+
+    def kernel(self, A, B, length_scale):
+
+        distance = np.sum((A[:, None, :] - B[None, :, :]) ** 2, axis = 2)
+
+        return np.exp(-0.5 * distance / length_scale ** 2)
+
+    def log_likelihood(self, length_scale):
+
+        K = self.kernel(self.X, self.X, length_scale) + self.nugget * np.eye(len(self.X))
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        alpha = sp.linalg.cho_solve((L, True), self.y)
+
+        return -0.5 * np.dot(self.y, alpha) - np.sum(np.log(np.diag(L)))
+
+    def factorize(self):
+
+        K          = self.kernel(self.X, self.X, self.length_scale) + self.nugget * np.eye(len(self.X))
+        self.L     = np.linalg.cholesky(K + 1E-10 * np.eye(len(self.X)))
+        self.alpha = sp.linalg.cho_solve((self.L, True), self.y)
+
+    def predict(self, X):
+
+        k    = self.kernel(self.normalize(X), self.X, self.length_scale)
+        mean = np.dot(k, self.alpha)
+        v    = sp.linalg.solve_triangular(self.L, k.T, lower = True)
+        var  = np.maximum(1. - np.sum(v ** 2, axis = 0), 1E-12)
+
+        return mean * self.y_std + self.y_mean, np.sqrt(var) * self.y_std
+
+    def add_point(self, x):
+        """Adds x with the predicted mean as its value, keeping the length scale."""
+
+        mean, _ = self.predict(x)
+        self.X  = np.vstack([self.X, self.normalize(x)])
+        self.y  = np.append(self.y, (mean[0] - self.y_mean) / self.y_std)
+        self.factorize()
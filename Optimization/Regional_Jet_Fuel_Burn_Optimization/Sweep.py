@@ -0,0 +1,221 @@
+# Sweep.py
+#
+# Evaluation of mission variants that only differ in payload, design range and cruise
+# altitude. The vehicle, configurations and analyses are built once and shared by every
+# variant across a pool of worker processes, and the trajectory sizing of all variants is
+# done in one vectorized call.
+#
+# Each variant is still solved as a mission of its own. Solving the residuals of all variants
+# together, stacked along a variant axis, is not done: every RCAIDE segment takes its initial
+# state from the last row of the segment before it and reads its parameters, such as the
+# cruise altitude and distance, as scalars, so it would take rewriting the segment processes.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import RCAIDE
+from RCAIDE.Framework.Core import Units, Data
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import Vehicles
+import Analyses
+import Missions
+import Procedure
+
+# ----------------------------------------------------------------------
+#   Run a small sweep
+# ----------------------------------------------------------------------
+def main():
+
+    configs  = Vehicles.setup()
+    analyses = Analyses.setup(configs)
+
+    # every variant flies through the same altitude band, so the atmosphere is interpolated
+    for analysis in analyses:
+        analysis.atmosphere.tabulated = True
+
+    # full factorial of payload x range x cruise altitude
+    payload, design_range, cruise_altitude = np.meshgrid(np.array([9000., 13063.]) * Units.kg,
+                                                         np.array([1000., 1500.]) * Units.nmi,
+                                                         np.array([9.5, 10.5])   * Units.km, indexing = 'ij')
+
+    variants = setup_variants(payload, design_range, cruise_altitude)
+
+    # results are streamed back in the order the variants finish
+    for i, summary in evaluate_missions_parallel(configs, analyses, variants):
+        print('payload = {:8.1f} kg, range = {:7.1f} nmi, altitude = {:5.2f} km, fuel burn = {:8.1f} kg'.format(
+            variants.payload[i]/Units.kg, variants.design_range[i]/Units.nmi,
+            variants.cruise_altitude[i]/Units.km, summary.fuel_burn/Units.kg))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Stack Variants
+# ----------------------------------------------------------------------
+def setup_variants(payload, design_range, cruise_altitude):
+    """Broadcasts the variant parameters against each other and stacks them along a single
+    leading axis, so every per-variant quantity is a flat array of length N."""
+
+    payload, design_range, cruise_altitude = np.broadcast_arrays(np.atleast_1d(payload).astype(float),
+                                                                 np.atleast_1d(design_range).astype(float),
+                                                                 np.atleast_1d(cruise_altitude).astype(float))
+
+    variants                    = Data()
+    variants.payload            = payload.ravel().copy()
+    variants.design_range       = design_range.ravel().copy()
+    variants.cruise_altitude    = cruise_altitude.ravel().copy()
+    variants.cruise_range       = None
+    variants.number_of_variants = len(variants.payload)
+
+    return variants
+
+# ----------------------------------------------------------------------
+#   Size Variants
+# ----------------------------------------------------------------------
+def size_variants(analyses, variants):
+
+    template              = Missions.mission_setup(analyses)
+    variants.cruise_range = np.atleast_1d(Procedure.compute_cruise_range(template,
+                                                                         variants.design_range,
+                                                                         variants.cruise_altitude))
+
+    return variants
+
+def apply_variant(mission, variants, i):
+
+    segments = mission.segments
+    segments['climb_3'].altitude_end     = variants.cruise_altitude[i]
+    segments['cruise'].altitude          = variants.cruise_altitude[i]
+    segments['descent_1'].altitude_start = variants.cruise_altitude[i]
+    segments['cruise'].distance          = variants.cruise_range[i]
+    mission.design_range                 = variants.design_range[i]
+    mission.payload                      = variants.payload[i]
+
+    return mission
+
+# ----------------------------------------------------------------------
+#   Mission Summary
+# ----------------------------------------------------------------------
+def summarize_mission(mission_results):
+
+    segments             = mission_results.segments
+    summary              = Data()
+    summary.takeoff_mass = float(segments[0].conditions.weights.total_mass[0, 0])
+    summary.landing_mass = float(segments[-1].conditions.weights.total_mass[-1, 0])
+    summary.fuel_burn    = summary.takeoff_mass - summary.landing_mass
+
+    return summary
+
+# ----------------------------------------------------------------------
+#   Parallel Evaluation
+# ----------------------------------------------------------------------
+
+# state shared with the worker processes. It is filled in by the parent before the pool is
+# created, so forked workers inherit the configurations and analyses without pickling them.
+_shared = Data()
+
+def evaluate_missions_parallel(configs, analyses, variants, max_workers = None):
+    """Fans the variants out over a process pool and yields (index, summary) pairs as each
+    mission finishes. Only the variant index is sent to a worker and only the small mission
+    summary comes back, so the cost of the pool does not grow with the size of the analyses."""
+
+    size_variants(analyses, variants)
+
+    _shared.configs         = configs
+    _shared.analyses        = analyses
+    _shared.variants        = variants
+    _shared.nominal_takeoff = store_takeoff_masses(configs)
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context     = multiprocessing.get_context('fork')
+        initializer = None
+        initargs    = ()
+    else:
+        # without fork every worker has to build its own vehicle and analyses once, set up
+        # with the same atmosphere options as the analyses of the parent
+        context     = multiprocessing.get_context('spawn')
+        initializer = initialize_worker
+        initargs    = (variants, atmosphere_settings(analyses))
+
+    executor = ProcessPoolExecutor(max_workers = max_workers, mp_context = context,
+                                   initializer = initializer, initargs = initargs)
+    try:
+        futures = [executor.submit(evaluate_variant, i) for i in range(variants.number_of_variants)]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # also reached when the caller stops iterating early, so no queued variant is solved
+        executor.shutdown(wait = True, cancel_futures = True)
+
+    return
+
+def initialize_worker(variants, settings):
+
+    configs                 = Vehicles.setup()
+    _shared.configs         = configs
+    _shared.analyses        = Analyses.setup(configs)
+    _shared.variants        = variants
+    _shared.nominal_takeoff = store_takeoff_masses(configs)
+    apply_atmosphere_settings(_shared.analyses, settings)
+
+    return
+
+# options a spawned worker has to set again on the atmosphere of each of its analyses
+atmosphere_options = ['tabulated', 'table_altitude_range', 'table_spacing', 'table_tolerance']
+
+def atmosphere_settings(analyses):
+
+    settings = {}
+    for tag, analysis in analyses.items():
+        settings[tag] = dict((option, analysis.atmosphere[option]) for option in atmosphere_options)
+
+    return settings
+
+def apply_atmosphere_settings(analyses, settings):
+
+    for tag, options in settings.items():
+        for option, value in options.items():
+            analyses[tag].atmosphere[option] = value
+
+    return analyses
+
+def evaluate_variant(i):
+
+    configs  = _shared.configs
+    variants = _shared.variants
+    mission  = Missions.mission_setup(_shared.analyses)
+    mission.tag = 'variant_' + str(i)
+    apply_variant(mission, variants, i)
+    set_payload(configs, _shared.nominal_takeoff, variants.payload[i])
+
+    return i, summarize_mission(mission.evaluate())
+
+# ----------------------------------------------------------------------
+#   Payload Handling
+# ----------------------------------------------------------------------
+def store_takeoff_masses(configs):
+
+    nominal_takeoff = Data()
+    for tag, config in configs.items():
+        nominal_takeoff[tag] = config.mass_properties.takeoff
+
+    return nominal_takeoff
+
+def set_payload(configs, nominal_takeoff, payload):
+    """Takeoff mass of the operating empty mass, the fuel and payload. The fuel load is held
+    fixed at that of the nominal takeoff mass with the maximum payload on board."""
+
+    for tag, config in configs.items():
+        mass_properties = config.mass_properties
+        fuel            = nominal_takeoff[tag] - mass_properties.operating_empty - mass_properties.max_payload
+        if fuel < 0.:
+            raise ValueError('the takeoff mass of ' + tag + ' is less than its operating empty mass with the maximum payload')
+        mass_properties.takeoff = mass_properties.operating_empty + fuel + payload
+
+    return configs
+
+if __name__ == '__main__':
+    main()
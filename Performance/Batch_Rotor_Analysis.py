@@ -0,0 +1,104 @@
+# Batch_Rotor_Analysis.py
+#
+# propeller_aerodynamic_analysis of a designed rotor at many operating points in one call.
+# Velocity, angular velocity, pitch command, altitude and temperature deviation may be arrays
+# of any broadcastable shapes. RCAIDE's blade element momentum analysis is already vectorized
+# over the control points of a segment, with one velocity and one angular velocity per point,
+# so all operating points that share a pitch command and an atmosphere are solved together as
+# the control points of a single call. A 50 x 50 x 10 velocity x RPM x pitch map is therefore
+# 10 calls instead of 500, and every point gets exactly the result of the library analysis.
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from RCAIDE.Framework.Core              import Data
+from RCAIDE.Library.Methods.Performance import propeller_aerodynamic_analysis
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Batch Rotor Analysis
+# ----------------------------------------------------------------------
+def batch_rotor_analysis(rotor, velocity, angular_velocity, pitch_command = 0., altitude = 0., delta_isa = 0.):
+    """Results of propeller_aerodynamic_analysis at every operating point.
+
+    Inputs:
+        rotor               designed rotor
+        velocity            axial freestream velocity                          [m/s]
+        angular_velocity    rotor angular velocity                             [rad/s]
+        pitch_command       blade pitch added to the twist                     [rad]
+        altitude            geometric altitude                                 [m]
+        delta_isa           temperature deviation from the standard atmosphere [K]
+
+    Returns:
+        results             Data of the per point results of the library analysis, with the
+                            broadcast shape of the inputs followed by the trailing axes of each
+                            result, such as the blade stations of the distributions
+    """
+
+    velocity, angular_velocity, pitch_command, altitude, delta_isa = np.broadcast_arrays(
+        *[np.asarray(value, dtype = float) for value in [velocity, angular_velocity, pitch_command, altitude, delta_isa]])
+    shape = velocity.shape
+
+    V     = velocity.ravel()
+    omega = angular_velocity.ravel()
+
+    # a rotor that neither turns nor moves has no loads, and no inflow angle for the blade
+    # element iteration to solve for, so its results are left at zero
+    moving = (V != 0.) | (omega != 0.)
+
+    # points with the same pitch command and atmosphere are the control points of one call
+    settings, group = np.unique(np.stack([pitch_command.ravel(), altitude.ravel(), delta_isa.ravel()], axis = 1),
+                                axis = 0, return_inverse = True)
+    group = group.ravel()
+
+    results = Data()
+    twist   = rotor.twist_distribution
+    try:
+        for index, (pitch, altitude_group, delta_isa_group) in enumerate(settings):
+            points = np.where((group == index) & moving)[0]
+            if len(points) == 0:
+                continue
+
+            # a new array rather than an in place change, so shared twist arrays stay intact
+            rotor.twist_distribution = twist + pitch
+            group_results = propeller_aerodynamic_analysis(rotor, V[points, None],
+                                                           angular_velocity = omega[points, None],
+                                                           angle_of_attack  = 0,
+                                                           altitude         = altitude_group,
+                                                           delta_isa        = delta_isa_group)
+            scatter_results(results, group_results, points, V.size)
+    finally:
+        rotor.twist_distribution = twist
+
+    return reshape_results(results, shape)
+
+def scatter_results(results, group_results, points, size):
+    """Copies the per point arrays of one call into the rows of points of results."""
+
+    for tag, value in group_results.items():
+        if isinstance(value, dict):
+            if tag not in results:
+                results[tag] = Data()
+            scatter_results(results[tag], value, points, size)
+        elif isinstance(value, np.ndarray) and value.ndim and value.shape[0] == len(points) and value.dtype != object:
+            if tag not in results:
+                results[tag] = np.zeros((size,) + value.shape[1:], dtype = value.dtype)
+            results[tag][points] = value
+
+    return
+
+def reshape_results(results, shape):
+    """Gives every array the shape of the operating points, dropping the column axis of the
+    quantities that have one value per point."""
+
+    for tag, value in results.items():
+        if isinstance(value, dict):
+            reshape_results(value, shape)
+        elif value.ndim == 2 and value.shape[1] == 1:
+            results[tag] = value.reshape(shape)
+        else:
+            results[tag] = value.reshape(shape + value.shape[1:])
+
+    return results
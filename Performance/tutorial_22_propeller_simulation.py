@@ -12,6 +12,7 @@ from RCAIDE.Framework.Core                              import Units
 from RCAIDE.Library.Plots                               import *    
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor import design_propeller 
 from RCAIDE.Library.Methods.Performance                 import propeller_aerodynamic_analysis
+from Batch_Rotor_Analysis                               import batch_rotor_analysis
 
 import os
 import numpy as np 
@@ -42,9 +43,42 @@ def main():
 
     # plot propeller 
     plot_3d_rotor(propeller) 
+    
+    # map the propeller over velocity, RPM and pitch in a single batched call 
+    map_results = propeller_map(propeller)
+    plot_propeller_map(map_results)
         
     return
 
+def propeller_map(propeller): 
+    
+    speeds  = np.linspace(1, 100, 50)
+    rpms    = np.linspace(1000, 3000, 50) * Units.rpm
+    pitches = np.linspace(-5, 4, 10) * Units.degrees
+    
+    velocity, angular_velocity, pitch_command = np.meshgrid(speeds, rpms, pitches, indexing = 'ij')
+    results = batch_rotor_analysis(propeller, velocity, angular_velocity, pitch_command, altitude = 0, delta_isa = 0)
+    
+    results.velocity         = velocity
+    results.angular_velocity = angular_velocity
+    results.pitch_command    = pitch_command
+    
+    return results
+
+def plot_propeller_map(results): 
+    
+    # efficiency over velocity and RPM at zero pitch command 
+    zero_pitch = np.argmin(np.abs(results.pitch_command[0, 0, :]))
+    
+    fig, axis = plt.subplots()
+    contour   = axis.contourf(results.velocity[:, :, zero_pitch], results.angular_velocity[:, :, zero_pitch] / Units.rpm,
+                              results.efficiency[:, :, zero_pitch], levels = np.linspace(0, 1, 11))
+    fig.colorbar(contour, ax = axis, label = 'Propeller Efficiency')
+    axis.set_xlabel('Velocity (m/s)')
+    axis.set_ylabel('RPM')
+    
+    return fig
+
 def design_test_propeller(): 
     
     prop                                     = RCAIDE.Library.Components.Propulsors.Converters.Propeller() 
@@ -29,6 +29,11 @@ def main():
     Mach_number_range                 = np.atleast_2d(np.linspace(0.1, 0.9, 10)).T
     angle_of_attack_range             = np.atleast_2d(np.linspace(-5, 12, 18)).T*Units.degrees 
     control_surface_deflection_range  = np.atleast_2d(np.linspace(0,30,7)).T*Units.degrees 
+
+    # with use_surrogate = True the vortex lattice solves are only run on the training grid of the
+    # aerodynamics analysis; the Mach x AoA x deflection grid below is evaluated on the surrogates,
+    # so refining angle_of_attack_range costs little. Setting use_surrogate = False solves the
+    # full grid directly and is much slower.
     results                           = aircraft_aerodynamic_analysis(vehicle, angle_of_attack_range, Mach_number_range,control_surface_deflection_range, altitude = 0,delta_ISA=0,use_surrogate = True,  model_fuselage = True)
   
     plot_aircraft_aerodynamics(results) 
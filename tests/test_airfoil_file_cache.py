@@ -0,0 +1,86 @@
+# test_airfoil_file_cache.py
+#
+# Airfoil imports routed through the binary airfoil cache.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+from RCAIDE.Framework.Core import Data
+
+import numpy as np
+import types
+import sys
+
+import Airfoil_File_Cache
+from Airfoil_File_Cache import cached_airfoil_imports
+
+@pytest.fixture
+def library(monkeypatch, tmp_path):
+    """An RCAIDE module with an airfoil polar import that counts how often it parses."""
+
+    module = types.ModuleType('RCAIDE_airfoil_cache_test')
+    calls  = []
+
+    def import_airfoil_polars(polar_files, airfoil_name = 'airfoil'):
+        calls.append(polar_files)
+        polars                   = Data()
+        polars.reynolds_number   = np.array([float(open(file).read()) for file in polar_files])
+        polars.files             = list(polar_files)
+        polars.name              = airfoil_name
+        polars.settings          = Data(points = 3)
+        return polars
+
+    module.import_airfoil_polars = import_airfoil_polars
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(Airfoil_File_Cache, 'cache_directory', str(tmp_path / 'cache'))
+    monkeypatch.setattr(Airfoil_File_Cache, '_memory_cache', {})
+
+    polar_file = tmp_path / 'polar.txt'
+    polar_file.write_text('50000')
+
+    return module, calls, str(polar_file)
+
+def test_parsed_once(library):
+
+    module, calls, polar_file = library
+    original = module.import_airfoil_polars
+
+    with cached_airfoil_imports():
+        first  = module.import_airfoil_polars([polar_file], 'NACA_4412')
+        second = module.import_airfoil_polars([polar_file], 'NACA_4412')
+
+    assert len(calls) == 1
+    assert module.import_airfoil_polars is original
+    assert np.all(second.reynolds_number == first.reynolds_number)
+    assert second is not first
+
+def test_archive(library):
+
+    module, calls, polar_file = library
+
+    with cached_airfoil_imports():
+        first = module.import_airfoil_polars([polar_file], 'NACA_4412')
+
+    # a new process only has the archive
+    Airfoil_File_Cache._memory_cache.clear()
+    with cached_airfoil_imports():
+        loaded = module.import_airfoil_polars([polar_file], 'NACA_4412')
+
+    assert len(calls) == 1
+    assert np.all(loaded.reynolds_number == first.reynolds_number)
+    assert loaded.files == first.files
+    assert loaded.name == 'NACA_4412'
+    assert loaded.settings.points == 3
+
+def test_edited_file(library, tmp_path):
+
+    module, calls, polar_file = library
+
+    with cached_airfoil_imports():
+        module.import_airfoil_polars([polar_file])
+        (tmp_path / 'polar.txt').write_text('100000')
+        edited = module.import_airfoil_polars([polar_file])
+
+    assert len(calls) == 2
+    assert edited.reynolds_number[0] == 100000.
@@ -0,0 +1,61 @@
+# test_batch_rotor_analysis.py
+#
+# The batched propeller analysis against one library call per operating point.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+from RCAIDE.Framework.Core import Data, Units
+
+import numpy as np
+
+import Batch_Rotor_Analysis
+from Batch_Rotor_Analysis import batch_rotor_analysis
+
+def point_analysis(rotor, velocity_range, angular_velocity, angle_of_attack, altitude, delta_isa):
+    """Stand in with one result per control point, which depends on every input."""
+
+    results        = Data()
+    results.thrust = velocity_range * angular_velocity + np.mean(rotor.twist_distribution) + altitude + delta_isa
+    results.blade  = Data(distribution = np.tile(rotor.twist_distribution, (len(velocity_range), 1)))
+
+    return results
+
+def test_grouping(monkeypatch):
+
+    monkeypatch.setattr(Batch_Rotor_Analysis, 'propeller_aerodynamic_analysis', point_analysis)
+
+    rotor                    = Data()
+    rotor.twist_distribution = np.array([0.1, 0.2, 0.3])
+
+    velocity, angular_velocity, pitch_command = np.meshgrid([0., 10., 20.], [0., 100.], [0., 0.05], indexing = 'ij')
+    results = batch_rotor_analysis(rotor, velocity, angular_velocity, pitch_command, altitude = 1000.)
+
+    expected = velocity * angular_velocity + 0.2 + pitch_command + 1000.
+    moving   = (velocity != 0.) | (angular_velocity != 0.)
+
+    assert results.thrust.shape == (3, 2, 2)
+    assert results.blade.distribution.shape == (3, 2, 2, 3)
+    assert np.allclose(results.thrust[moving], expected[moving])
+    assert np.all(results.thrust[~moving] == 0.)
+    assert np.allclose(results.blade.distribution[1, 1, 1], rotor.twist_distribution + 0.05)
+    assert np.all(rotor.twist_distribution == np.array([0.1, 0.2, 0.3]))
+
+def test_matches_library():
+
+    tutorial  = pytest.importorskip('tutorial_22_propeller_simulation')
+    propeller = tutorial.design_test_propeller()
+
+    speeds = np.array([20., 60.])
+    rpms   = np.array([2000., 2500.]) * Units.rpm
+
+    velocity, angular_velocity = np.meshgrid(speeds, rpms, indexing = 'ij')
+    results = batch_rotor_analysis(propeller, velocity, angular_velocity)
+
+    for i, V in enumerate(speeds):
+        for j, omega in enumerate(rpms):
+            point = Batch_Rotor_Analysis.propeller_aerodynamic_analysis(propeller, np.array([[V]]), angular_velocity = omega,
+                                                                        angle_of_attack = 0, altitude = 0, delta_isa = 0)
+            assert np.isclose(results.thrust[i, j], np.ravel(point.thrust)[0], rtol = 1E-6)
+            assert np.isclose(results.power[i, j], np.ravel(point.power)[0], rtol = 1E-6)
@@ -0,0 +1,42 @@
+# test_benchmark.py
+#
+# Regression detection of the tutorial benchmark harness.
+
+from Benchmark import find_regressions
+
+def result(wall_time, peak_rss_MB, status = 'passed'):
+
+    return dict(status = status, wall_time = wall_time, peak_rss_MB = peak_rss_MB)
+
+def test_no_baseline():
+
+    assert find_regressions({'tutorial_01' : result(10., 100.)}, None, 0.2) == []
+
+def test_within_tolerance():
+
+    baseline = dict(results = {'tutorial_01' : result(10., 100.)})
+
+    assert find_regressions({'tutorial_01' : result(11.9, 119.)}, baseline, 0.2) == []
+
+def test_slower_and_larger():
+
+    baseline    = dict(results = {'tutorial_01' : result(10., 100.)})
+    regressions = find_regressions({'tutorial_01' : result(12.5, 130.)}, baseline, 0.2)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith('tutorial_01: wall_time')
+    assert regressions[1].startswith('tutorial_01: peak_rss_MB')
+
+def test_failed_case():
+
+    baseline = dict(results = {'tutorial_01' : result(10., 100.)})
+
+    assert find_regressions({'tutorial_01' : result(0., 0., 'failed')}, baseline, 0.2) == ['tutorial_01 failed']
+
+def test_cases_without_reference():
+
+    # cases that failed in the baseline, or were not run this time, are not compared
+    baseline = dict(results = {'tutorial_01' : result(10., 100., 'failed'),
+                               'tutorial_02' : result(10., 100.)})
+
+    assert find_regressions({'tutorial_01' : result(50., 500.)}, baseline, 0.2) == []
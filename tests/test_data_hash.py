@@ -0,0 +1,68 @@
+# test_data_hash.py
+#
+# Content hashes and pickle cache folders shared by the on-disk caches of the tutorials.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+import numpy as np
+import os
+
+from Data_Hash import data_hash, trusted_directory, load_pickle, save_pickle, user_cache_directory
+
+def test_key_order():
+
+    assert data_hash({'a' : 1., 'b' : [1, 2]}) == data_hash({'b' : [1, 2], 'a' : 1.})
+    assert data_hash({'a' : 1.}) != data_hash({'a' : 2.})
+
+def test_exclude():
+
+    assert data_hash({'a' : 1., 'tag' : 'x'}, exclude = ['tag']) == data_hash({'a' : 1., 'tag' : 'y'}, exclude = ['tag'])
+
+def test_cycle():
+
+    value = {'a' : 1.}
+    value['self'] = value
+
+    assert data_hash(value) == data_hash(value)
+
+def test_arrays():
+
+    assert data_hash(np.zeros(4)) != data_hash(np.zeros(4, dtype = np.float32))
+    assert data_hash(np.zeros(4)) != data_hash(np.zeros((2, 2)))
+    assert data_hash(np.arange(4.)) == data_hash(np.arange(4.))
+
+def test_file_content(tmp_path):
+
+    path = tmp_path / 'airfoil.txt'
+    path.write_text('0.0 0.0\n')
+    before = data_hash(str(path))
+    path.write_text('1.0 0.0\n')
+
+    assert data_hash(str(path)) != before
+
+def test_user_cache_directory(monkeypatch, tmp_path):
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    assert user_cache_directory('name') == os.path.join(str(tmp_path), 'rcaide_tutorials', 'name')
+
+def test_pickle_round_trip(tmp_path):
+
+    directory = str(tmp_path / 'cache')
+    save_pickle(directory, 'key', {'a' : np.arange(3.)})
+
+    assert trusted_directory(directory)
+    assert np.all(load_pickle(directory, 'key')['a'] == np.arange(3.))
+    assert load_pickle(directory, 'missing') is None
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason = 'no file ownership')
+def test_untrusted_directory(tmp_path):
+
+    directory = str(tmp_path / 'cache')
+    save_pickle(directory, 'key', 1.)
+    os.chmod(directory, 0o777)
+
+    assert not trusted_directory(directory)
+    assert load_pickle(directory, 'key') is None
@@ -0,0 +1,81 @@
+# test_fast_atmosphere.py
+#
+# Exact and tabulated Fast_US_Standard_1976 against the layer law of the 1976 standard, written
+# out here layer by layer from the break points of the model.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+import numpy as np
+import warnings
+
+from Fast_Atmosphere import Fast_US_Standard_1976
+
+def layer_law(atmosphere, altitude, temperature_deviation = 0.):
+    """Pressure, temperature and density at geometric altitudes, one layer at a time."""
+
+    breaks = atmosphere.breaks
+    grav   = atmosphere.planet.sea_level_gravity
+    R      = atmosphere.fluid_properties.gas_specific_constant
+    zs     = altitude / (1. + altitude / atmosphere.planet.mean_radius)
+
+    p = np.zeros_like(zs)
+    T = np.zeros_like(zs)
+    for i in range(len(breaks.altitude) - 1):
+        layer = (zs >= breaks.altitude[i]) & (zs < breaks.altitude[i + 1])
+        dz    = zs[layer] - breaks.altitude[i]
+        T0    = breaks.temperature[i]
+        lapse = (breaks.temperature[i + 1] - T0) / (breaks.altitude[i + 1] - breaks.altitude[i])
+        if lapse == 0.:
+            T[layer] = T0
+            p[layer] = breaks.pressure[i] * np.exp(-grav * dz / (R * T0))
+        else:
+            T[layer] = T0 + lapse * dz
+            p[layer] = breaks.pressure[i] * (T[layer] / T0) ** (-grav / (R * lapse))
+
+    T = T + temperature_deviation
+
+    return p, T, p / (R * T)
+
+def assert_layer_law(values, expected, rtol):
+
+    for name, value in zip(['pressure', 'temperature', 'density'], expected):
+        assert np.allclose(values[name], value, rtol = rtol, atol = 0.), name
+
+# geometric altitudes across the troposphere and the lower stratosphere, with the 11 km break
+altitudes = np.concatenate([np.linspace(0., 15000., 301), [11019.05, 11019.07]])[:, None]
+
+@pytest.mark.parametrize('temperature_deviation', [0., 15.])
+def test_exact_values(temperature_deviation):
+
+    atmosphere = Fast_US_Standard_1976()
+    values     = atmosphere.compute_values(altitudes, temperature_deviation)
+
+    assert values.pressure.shape == altitudes.shape
+    assert_layer_law(values, layer_law(atmosphere, altitudes, temperature_deviation), 1E-10)
+
+@pytest.mark.parametrize('temperature_deviation', [0., 15.])
+def test_tabulated_values(temperature_deviation):
+
+    atmosphere           = Fast_US_Standard_1976()
+    atmosphere.tabulated = True
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        values = atmosphere.compute_values(altitudes, temperature_deviation)
+
+    table = atmosphere.property_tables[temperature_deviation]
+    assert max(table.maximum_error.values()) <= atmosphere.table_tolerance
+    assert values.pressure.shape == altitudes.shape
+    assert_layer_law(values, layer_law(atmosphere, altitudes, temperature_deviation), atmosphere.table_tolerance)
+
+def test_outside_table():
+
+    atmosphere           = Fast_US_Standard_1976()
+    atmosphere.tabulated = True
+    altitude             = np.array([[16000.], [18000.]])
+    values               = atmosphere.compute_values(altitude)
+
+    # altitudes above the table band are evaluated exactly, without building a table
+    assert not atmosphere.property_tables
+    assert_layer_law(values, layer_law(atmosphere, altitude), 1E-10)
@@ -0,0 +1,157 @@
+# test_fast_nexus.py
+#
+# Evaluation, caching and gradients of the Fast_Nexus on a small analytic problem.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Framework.Analyses.Process import Process
+
+import numpy as np
+
+from Fast_Nexus import Fast_Nexus
+
+def analytic_step(nexus):
+
+    base                 = nexus.vehicle_configurations.base
+    nexus.summary.f      = (base.a - 1.) ** 2 + (base.b - 2.) ** 2
+    nexus.summary.g      = base.a + base.b
+
+    return nexus
+
+def analytic_nexus():
+    """Minimize (a - 1)^2 + (b - 2)^2 subject to a + b < 2."""
+
+    nexus                        = Fast_Nexus()
+    nexus.max_workers            = 2
+    nexus.vehicle_configurations = Data(base = Data(a = 0., b = 0.))
+    nexus.missions               = Data()
+    nexus.procedure              = Process()
+    nexus.procedure.analytic     = analytic_step
+    nexus.summary                = Data()
+    nexus.total_number_of_iterations = 0
+
+    problem                    = Data()
+    problem.inputs             = np.array([[ 'a', 0., -5., 5., 1., 1.],
+                                           [ 'b', 0., -5., 5., 1., 1.]], dtype = object)
+    problem.objective          = np.array([[ 'f', 1., 1.]], dtype = object)
+    problem.constraints        = np.array([[ 'g', '<', 2., 1., 1.]], dtype = object)
+    problem.aliases            = [[ 'a', 'vehicle_configurations.base.a'],
+                                  [ 'b', 'vehicle_configurations.base.b'],
+                                  [ 'f', 'summary.f'],
+                                  [ 'g', 'summary.g']]
+    nexus.optimization_problem = problem
+
+    return nexus
+
+def test_parallel_gradients():
+
+    nexus = analytic_nexus()
+    with nexus.optimizer_evaluations():
+        gradients = nexus.evaluate_gradients(np.array([0., 0.]))
+        executor  = nexus.executor
+        nexus.evaluate_gradients(np.array([0.5, 0.5]))
+
+        # one pool for the whole optimization
+        assert executor is not None
+        assert nexus.executor is executor
+
+    assert nexus.executor is None
+    assert np.allclose(gradients.objective, [-2., -4.], atol = 1E-5)
+    assert np.allclose(gradients.inequality_constraint, [[-1., -1.]], atol = 1E-5)
+
+def test_spawned_workers(monkeypatch):
+
+    import Fast_Nexus as module
+    monkeypatch.setattr(module.multiprocessing, 'get_all_start_methods', lambda: ['spawn'])
+
+    nexus = analytic_nexus()
+    with nexus.optimizer_evaluations():
+        gradients = nexus.evaluate_gradients(np.array([0., 0.]))
+
+    assert np.allclose(gradients.objective, [-2., -4.], atol = 1E-5)
+
+def test_reuse_counts():
+
+    nexus = analytic_nexus()
+    nexus.objective(np.array([0., 0.]))
+    nexus.objective(np.array([0., 0.]))
+    nexus.objective(np.array([1., 1.]))
+
+    # a known point whose results are no longer on the nexus is solved again, not a hit
+    nexus.objective(np.array([0., 0.]))
+
+    assert nexus.cache_hits   == 1
+    assert nexus.cache_misses == 3
+
+    with nexus.optimizer_evaluations():
+        nexus.objective(np.array([1., 1.]))
+
+    assert nexus.cache_hits   == 2
+    assert nexus.cache_misses == 3
+
+def a_step(nexus):
+
+    nexus.summary.fa = (nexus.vehicle_configurations.base.a - 1.) ** 2
+
+    return nexus
+
+def b_step(nexus):
+
+    nexus.summary.fb = (nexus.vehicle_configurations.base.b - 2.) ** 2
+
+    return nexus
+
+def sum_step(nexus):
+
+    base            = nexus.vehicle_configurations.base
+    nexus.summary.f = nexus.summary.fa + nexus.summary.fb
+    nexus.summary.g = base.a + base.b
+
+    return nexus
+
+def declared_nexus():
+
+    nexus                    = analytic_nexus()
+    nexus.procedure          = Process()
+    nexus.procedure.sizing   = Process()
+    nexus.procedure.sizing.a = a_step
+    nexus.procedure.sizing.b = b_step
+    nexus.procedure.total    = sum_step
+    nexus.step_inputs        = {'sizing.a' : ['a'], 'sizing.b' : ['b']}
+
+    return nexus
+
+def test_declared_steps_skip():
+
+    nexus = declared_nexus()
+    assert nexus.objective(np.array([0., 0.])) == pytest.approx(5.)
+    assert nexus.skipped_steps == 0
+
+    # only a changed, so the step of b keeps its result
+    assert nexus.objective(np.array([0.5, 0.])) == pytest.approx(4.25)
+    assert nexus.skipped_steps == 1
+
+    assert nexus.objective(np.array([0.5, 1.])) == pytest.approx(1.25)
+    assert nexus.skipped_steps == 2
+
+def test_gradient_skips_in_this_process():
+
+    nexus = declared_nexus()
+    with nexus.optimizer_evaluations():
+        nexus.objective(np.array([0., 0.]))
+        gradients = nexus.evaluate_gradients(np.array([0., 0.]))
+
+    # the perturbation of a is solved here, right after the point, without the step of b
+    assert nexus.skipped_steps == 1
+    assert np.allclose(gradients.objective, [-2., -4.], atol = 1E-5)
+
+def test_unknown_step():
+
+    nexus             = declared_nexus()
+    nexus.step_inputs = {'sizing.c' : ['a']}
+
+    with pytest.raises(ValueError):
+        nexus.objective(np.array([0., 0.]))
@@ -0,0 +1,128 @@
+# test_mission_adjoint.py
+#
+# Adjoint gradients of the Fast_Nexus against finite differences of full mission solves, on a
+# mission of two small segments whose residuals depend on the inputs and on the mass each
+# segment starts from.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Framework.Analyses.Process import Process
+
+import numpy as np
+
+from Mission_Adjoint import enable_adjoint
+from test_fast_nexus import analytic_nexus
+
+def segment_conditions(points):
+
+    conditions = Data()
+    conditions.weights  = Data(total_mass = np.zeros((points, 1)))
+    conditions.frames   = Data(inertial = Data(position_vector = np.zeros((points, 3)), time = np.zeros((points, 1))))
+    conditions.energy   = Data()
+
+    return conditions
+
+def initialize_segment(segment):
+
+    segment.state.unknowns.burn = np.ones((3, 1))
+
+    return
+
+def segment_residuals(segment):
+    """Burn u per point solves u^2 + u = rate * m0 / 100, and the mass drops by the burn."""
+
+    start      = segment.state.initials.conditions
+    conditions = segment.state.conditions
+    burn       = segment.state.unknowns.burn
+    mass       = start.weights.total_mass[-1, 0]
+    rate       = segment.vehicle[segment.rate]
+
+    conditions.weights.total_mass             = mass - np.cumsum(burn, axis = 0)
+    conditions.frames.inertial.time           = start.frames.inertial.time[-1, 0] + np.arange(1., 4.)[:, None]
+    conditions.frames.inertial.position_vector = start.frames.inertial.position_vector[-1] + np.cumsum(burn, axis = 0) * np.array([1., 0., 0.])
+    segment.state.residuals.burn              = burn ** 2 + burn - rate * mass / 100.
+
+    return
+
+def mission_segment(tag, vehicle, rate):
+
+    segment                           = Data(tag = tag, vehicle = vehicle, rate = rate)
+    segment.state                     = Data()
+    segment.state.numerics            = Data(tolerance_solution = 1E-8)
+    segment.state.unknowns            = Data(burn = np.ones((3, 1)))
+    segment.state.residuals           = Data(burn = np.zeros((3, 1)))
+    segment.state.conditions          = segment_conditions(3)
+    segment.state.initials            = Data(conditions = segment_conditions(1))
+    segment.process                   = Process()
+    segment.process.initialize        = Process()
+    segment.process.initialize.guess  = initialize_segment
+    segment.process.converge          = None
+    segment.process.iterate           = Process()
+    segment.process.iterate.residuals = segment_residuals
+
+    return segment
+
+def fly_mission(nexus):
+
+    previous = None
+    for segment in nexus.missions.base.segments:
+        if previous is not None:
+            segment.state.initials = previous.state
+        segment.process.initialize(segment)
+        segment.process.converge(segment)
+        previous = segment
+
+    return nexus
+
+def post_process(nexus):
+
+    segments        = nexus.missions.base.segments
+    base            = nexus.vehicle_configurations.base
+    nexus.summary.f = 100. - segments.second.state.conditions.weights.total_mass[-1, 0]
+    nexus.summary.g = base.a + base.b
+    nexus.total_number_of_iterations += 1
+
+    return nexus
+
+def mission_nexus():
+
+    nexus   = analytic_nexus()
+    vehicle = nexus.vehicle_configurations.base
+    mission = Data(tag = 'base', segments = Data())
+    mission.segments.first  = mission_segment('first', vehicle, 'a')
+    mission.segments.second = mission_segment('second', vehicle, 'b')
+    mission.segments.first.state.initials.conditions.weights.total_mass[:] = 100.
+    enable_adjoint(mission)
+
+    nexus.missions               = Data(base = mission)
+    nexus.procedure              = Process()
+    nexus.procedure.mission      = fly_mission
+    nexus.procedure.post_process = post_process
+
+    return nexus
+
+def test_adjoint_gradients():
+
+    x = np.array([1., 2.])
+
+    reference = mission_nexus()
+    with reference.optimizer_evaluations():
+        expected = reference.evaluate_gradients(x)
+
+    nexus                 = mission_nexus()
+    nexus.gradient_method = 'adjoint'
+    nexus.adjoint_steps   = ['post_process']
+    with nexus.optimizer_evaluations():
+        fuel      = nexus.objective(x)
+        gradients = nexus.evaluate_gradients(x)
+
+    assert np.allclose(gradients.objective, expected.objective, rtol = 1E-4)
+    assert np.allclose(gradients.inequality_constraint, expected.inequality_constraint, rtol = 1E-4)
+
+    # the held runs are not counted as evaluations and leave the results of x on the nexus
+    assert nexus.total_number_of_iterations == 1
+    assert nexus.summary.f == pytest.approx(fuel[0])
+    assert nexus.objective(x) == pytest.approx(fuel)
@@ -0,0 +1,102 @@
+# test_segment_solvers.py
+#
+# Jacobian coloring of the segment Newton solvers and the discretization error estimate of the
+# adaptive control points.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+from RCAIDE.Framework.Core import Data
+
+import numpy as np
+
+from Segment_Solvers import greedy_coloring, detect_coloring, chebyshev_error, collapse_rows
+
+def check_coloring(pattern, colors):
+    """Every column has exactly one color and no two columns of a color share a row."""
+
+    columns = np.concatenate([color.columns for color in colors.values()])
+    assert np.array_equal(np.sort(columns), np.arange(pattern.shape[1]))
+    for color in colors.values():
+        assert np.all(np.sum(pattern[:, color.columns], axis = 1) <= 1)
+        for column, rows in zip(color.columns, color.rows):
+            assert np.array_equal(rows, np.where(pattern[:, column])[0])
+
+def test_block_diagonal():
+
+    # 4 control points with 3 coupled unknowns each
+    pattern = np.kron(np.eye(4, dtype = bool), np.ones((3, 3), dtype = bool))
+    colors  = greedy_coloring(pattern)
+
+    check_coloring(pattern, colors)
+    assert len(colors) == 3
+
+def test_dense_row():
+
+    # a scalar residual depending on every unknown makes every column a color of its own
+    pattern = np.vstack([np.eye(5, dtype = bool), np.ones((1, 5), dtype = bool)])
+    colors  = greedy_coloring(pattern)
+
+    check_coloring(pattern, colors)
+    assert len(colors) == 5
+
+def test_detect_drops_weak_entries():
+
+    jacobian = np.array([[1.,    0.,    1E-4, 0.  ],
+                         [0.,    2.,    0.,   0.  ],
+                         [1E-5,  0.,    3.,   0.  ],
+                         [0.,    0.,    0.,   4.  ]])
+    segment  = Data()
+    colors   = detect_coloring(segment, jacobian, 1E-2)
+
+    # the weak couplings are left out, so every unknown shares a single color
+    assert len(colors) == 1
+    assert segment.jacobian_coloring.shape == jacobian.shape
+    assert segment.jacobian_coloring.colors is colors
+
+    # and kept when the tolerance is below them
+    assert len(detect_coloring(segment, jacobian, 1E-6)) == 2
+
+def chebyshev_points(n):
+
+    return 0.5 * (1. - np.cos(np.linspace(0., np.pi, n)))
+
+def test_chebyshev_error_smooth():
+
+    points = chebyshev_points(16)
+
+    assert chebyshev_error(np.sin(points), points) < 1E-6
+    assert chebyshev_error(np.ones(16), points) == 0.
+
+def test_chebyshev_error_unresolved():
+
+    coarse = chebyshev_points(8)
+    fine   = chebyshev_points(32)
+
+    # a kink is not resolved by a few points, and resolved better by more
+    error_coarse = chebyshev_error(np.abs(coarse - 0.4), coarse)
+    error_fine   = chebyshev_error(np.abs(fine - 0.4), fine)
+
+    assert error_coarse > 1E-3
+    assert error_fine < error_coarse
+
+def test_chebyshev_error_too_few_points():
+
+    assert chebyshev_error(np.zeros(2), np.array([0., 1.])) == np.inf
+
+def test_collapse_rows():
+
+    state                      = Data()
+    state.unknowns             = Data(throttle = np.ones((4, 1)), duration = np.ones((1, 1)))
+    state.conditions           = Data(distribution = np.ones((4, 3, 2)))
+    state.initials             = Data(mass = np.ones((4, 1)))
+    state.numerics             = Data(points = np.ones((4, 1)))
+
+    collapse_rows(state, 4)
+
+    assert state.unknowns.throttle.shape == (1, 1)
+    assert state.unknowns.duration.shape == (1, 1)
+    assert state.conditions.distribution.shape == (1, 3, 2)
+    assert state.initials.mass.shape == (4, 1)
+    assert state.numerics.points.shape == (4, 1)
@@ -0,0 +1,63 @@
+# test_shared_rotor_data.py
+#
+# Read-only rotor arrays shared by deepcopy and pickle instead of being duplicated.
+
+import pytest
+
+import numpy as np
+import pickle
+from copy import deepcopy
+
+from Shared_Rotor_Data import Shared_Array, shared_array, share_rotor_data
+
+def test_deepcopy_shares_frozen_arrays():
+
+    array  = shared_array(np.linspace(0., 1., 5))
+    copied = deepcopy({'a' : array, 'b' : [array]})
+
+    assert copied['a'] is array
+    assert copied['b'][0] is array
+
+def test_deepcopy_copies_writable_arrays():
+
+    array  = np.arange(3.).view(Shared_Array)
+    copied = deepcopy(array)
+
+    assert copied is not array
+    assert type(copied) is np.ndarray
+    assert np.all(copied == array)
+
+def test_pickle_keeps_one_frozen_copy():
+
+    array    = shared_array(np.linspace(0., 1., 5))
+    reloaded = pickle.loads(pickle.dumps({'a' : array, 'b' : array}))
+
+    assert reloaded['a'] is reloaded['b']
+    assert isinstance(reloaded['a'], Shared_Array)
+    assert not reloaded['a'].flags.writeable
+    assert np.all(reloaded['a'] == array)
+
+def test_frozen_arrays_stay_intact():
+
+    array = shared_array(np.ones(3))
+
+    with pytest.raises(ValueError):
+        array[0] = 2.
+
+    # results and copies are ordinary writable arrays
+    result = array * 2.
+    copy   = array.copy()
+    assert type(result) is np.ndarray and result.flags.writeable
+    assert type(copy) is np.ndarray and copy.flags.writeable
+
+def test_share_rotor_data_freezes_static_fields():
+
+    airfoil = {'geometry' : {'x_coordinates' : np.linspace(0., 1., 4)}, 'polars' : {'lift' : {'cl' : np.ones(2)}}, 'tag' : 'naca'}
+    rotor   = {'chord_distribution' : np.ones(4), 'inputs' : {'omega' : np.ones(1)}, 'airfoils' : {'naca' : airfoil}}
+    share_rotor_data(rotor)
+
+    assert isinstance(rotor['chord_distribution'], Shared_Array)
+    assert isinstance(airfoil['geometry']['x_coordinates'], Shared_Array)
+    assert isinstance(airfoil['polars']['lift']['cl'], Shared_Array)
+    assert type(rotor['inputs']['omega']) is np.ndarray
+    assert deepcopy(rotor)['chord_distribution'] is rotor['chord_distribution']
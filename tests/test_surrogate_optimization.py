@@ -0,0 +1,55 @@
+# test_surrogate_optimization.py
+#
+# Latin hypercube sampling, Gaussian process models and the surrogate driver on the analytic
+# problem of test_fast_nexus.
+
+import pytest
+
+RCAIDE = pytest.importorskip('RCAIDE')
+
+import numpy as np
+
+from Surrogate_Optimization import Surrogate_Solve, latin_hypercube, Gaussian_Process
+from test_fast_nexus import analytic_nexus
+
+def test_latin_hypercube_strata():
+
+    n       = 12
+    samples = latin_hypercube(n, 3, np.random.default_rng(0))
+
+    assert samples.shape == (n, 3)
+    assert np.all((samples >= 0.) & (samples < 1.))
+    # exactly one point in each of the n slices of every axis
+    assert np.all(np.sort(np.floor(samples * n), axis = 0) == np.arange(n)[:, None])
+
+def test_gaussian_process_interpolates():
+
+    lower = np.array([0., 0.])
+    upper = np.array([2., 1.])
+    X     = lower + (upper - lower) * latin_hypercube(20, 2, np.random.default_rng(1))
+    y     = np.sin(X[:, 0]) + X[:, 1] ** 2
+    model = Gaussian_Process(X, y, lower, upper)
+
+    mean, std = model.predict(X)
+    assert np.allclose(mean, y, atol = 1E-3)
+    assert np.all(std < 1E-2)
+
+    x         = np.array([[1., 0.5]])
+    mean, std = model.predict(x)
+    assert mean[0] == pytest.approx(np.sin(1.) + 0.25, abs = 0.05)
+
+    # a point added at its predicted mean keeps the prediction and removes the uncertainty
+    model.add_point(x)
+    new_mean, new_std = model.predict(x)
+    assert new_mean[0] == pytest.approx(mean[0], abs = 1E-4)
+    assert new_std[0] < std[0]
+
+def test_surrogate_solve():
+
+    nexus = analytic_nexus()
+    x     = Surrogate_Solve(nexus, max_evaluations = 30, batch_size = 2)
+
+    # minimum of (a - 1)^2 + (b - 2)^2 on a + b < 2
+    assert x[0] + x[1] <= 2. + 1E-6
+    assert np.allclose(x, [0.5, 1.5], atol = 0.15)
+    assert nexus.executor is None